@@ -51,21 +51,71 @@ def np_to_mat(value: Any):
     else:
         # Unknown type -> let caller decide (e.g., push_struct will recurse or raise)
         return value
+
+
+# MATLAB statement builders shared by the per-field setters and sim.batch_init()
+
+def _mat_str(value: Any) -> str:
+    """Quote a Python value as a MATLAB char literal (single quotes doubled)"""
+    return "'" + str(value).replace("'", "''") + "'"
+
+def _isotopes_stmt(var: str, isotopes: Sequence[str]) -> str:
+    return f"{var}.isotopes = {{{','.join(_mat_str(s) for s in isotopes)}}};"
+
+def _magnet_stmt(var: str, value: float) -> str:
+    return f"{var}.magnet = {float(value)!r};"
+
+def _formalism_stmt(var: str, formalism: str) -> str:
+    return f"{var}.formalism = {_mat_str(formalism)};"
+
+def _approximation_stmt(var: str, approximation: str) -> str:
+    return f"{var}.approximation = {_mat_str(approximation)};"
+
+def _zeeman_stmt(var: str, values: Sequence[Optional[float]]) -> str:
+    items = " ".join("0.0" if v is None else repr(float(v)) for v in values)
+    return f"{var}.zeeman.scalar = {{{items}}};"
+
+def _coupling_stmts(var: str, tmp_var: str, empty_diagonal: bool) -> str:
+    """inter.coupling.scalar from the matrix in tmp_var, optionally with an empty diagonal"""
+    stmts = f"{var}.coupling.scalar = num2cell({tmp_var});\n"
+    if empty_diagonal:
+        stmts += f"for k = 1:size({tmp_var},1), {var}.coupling.scalar{{k,k}} = []; end\n"
+    return stmts
     
 
-def start_spinach_eng(clean: bool = True):
-    eng = matlab.engine.start_matlab()
-    if clean:
+def _open_engine(attach_name: Optional[str] = None):
+    """Connect to the shared MATLAB session `attach_name` if it is running,
+    otherwise start a new engine. Returns (eng, attached)."""
+    if attach_name and attach_name in matlab.engine.find_matlab():
+        return matlab.engine.connect_matlab(attach_name), True
+    return matlab.engine.start_matlab(), False
+
+def start_spinach_eng(clean: bool = True, attach_name: Optional[str] = None):
+    eng, attached = _open_engine(attach_name)
+    # Never wipe the workspace of a user's shared session
+    if clean and not attached:
         eng.eval("clear all", nargout=0)
     return eng
 
 @contextmanager
-def spinach_eng(clean: bool = True):
-    eng = start_spinach_eng(clean=clean)
+def spinach_eng(clean: bool = True, attach_name: Optional[str] = None):
+    """
+    Engine context manager. With attach_name, reuse a MATLAB session shared via
+    matlab.engine.shareEngine(attach_name) and leave it running on exit, so
+    repeated runs skip the MATLAB cold start.
+
+    clean runs "clear all" only in an engine started here. An attached session
+    belongs to the user, so its workspace is left alone; callers should clear
+    just the variables they create there.
+    """
+    eng, attached = _open_engine(attach_name)
+    if clean and not attached:
+        eng.eval("clear all", nargout=0)
     try:
         yield eng
     finally:
-        eng.quit()
+        if not attached:
+            eng.quit()
 
 class call_spinach:
     """
@@ -174,11 +224,10 @@ class sys(call_spinach):
         self.var_name = f"{var_prefix}sys" if var_prefix else "sys"
 
     def isotopes(self, isotopes: Sequence[str]):
-        iso_cell = "{" + ",".join([f"'{s}'" for s in isotopes]) + "}"
-        self.eng.eval(f"{self.var_name}.isotopes = {iso_cell};", nargout=0)
+        self.eng.eval(_isotopes_stmt(self.var_name, isotopes), nargout=0)
 
     def magnet(self, value: float):
-        self.eng.eval(f"{self.var_name}.magnet = {value};", nargout=0)
+        self.eng.eval(_magnet_stmt(self.var_name, value), nargout=0)
 
 class bas(call_spinach):
 
@@ -187,10 +236,10 @@ class bas(call_spinach):
         self.var_name = f"{var_prefix}bas" if var_prefix else "bas"
 
     def formalism(self, formalism: str):
-        self.eng.eval(f"{self.var_name}.formalism = '{formalism}';", nargout=0)
+        self.eng.eval(_formalism_stmt(self.var_name, formalism), nargout=0)
     
     def approximation(self, approximation):
-        self.eng.eval(f"{self.var_name}.approximation = '{approximation}';", nargout=0)
+        self.eng.eval(_approximation_stmt(self.var_name, approximation), nargout=0)
 
     def sym_group(self, sym_group):
         print(f"DEBUG spinach_bridge.sym_group() called with: {sym_group} (type: {type(sym_group)})")
@@ -253,7 +302,7 @@ class parameters(call_spinach):
 
     @staticmethod
     def _q(s: str) -> str:
-        return "'" + str(s).replace("'", "''") + "'"
+        return _mat_str(s)
     
     def _field(self, key: str) -> str:
         k = str(key).replace("'", "''")   
@@ -333,14 +382,7 @@ class inter(call_spinach):
         self.var_name = f"{var_prefix}inter" if var_prefix else "inter"
 
     def zeeman(self, values: Sequence[Optional[float]]):
-        items = []
-        for v in values:
-            if v is None:
-                items.append("0.0")
-            else:
-                items.append(repr(float(v)))
-        cell_lit = "{" + " ".join(items) + "}"
-        self.eng.eval(f"{self.var_name}.zeeman.scalar = {cell_lit};", nargout=0)
+        self.eng.eval(_zeeman_stmt(self.var_name, values), nargout=0)
 
     def temperature(self, value: float):
         self.eng.eval(f"{self.var_name}.temperature = {float(value)};", nargout=0)
@@ -375,17 +417,10 @@ class inter(call_spinach):
         if use_gpu:
             self.use_gpu(True)
             self.eng.eval(f"{tmp_var} = gpuArray({tmp_var});", nargout=0)
-        self.eng.eval(f"""
-            {self.var_name}.coupling.scalar = num2cell({tmp_var});
-        """, nargout=0)
-        if empty_diagonal:
-            self.eng.eval(f"""
-                for k = 1:size({tmp_var},1)
-                    {self.var_name}.coupling.scalar{{k,k}} = [];
-                end
-            """, nargout=0)
-
-        self.eng.eval(f"clear {tmp_var};", nargout=0)
+        self.eng.eval(
+            _coupling_stmts(self.var_name, tmp_var, empty_diagonal) + f"clear {tmp_var};",
+            nargout=0
+        )
 
 class sim(call_spinach):
 
@@ -402,6 +437,37 @@ class sim(call_spinach):
         self.eng.eval(f"{build_name} = @(sys,inter,bas) basis(create(sys,inter), bas);", nargout=0)
         self.eng.eval(f"{self.var_name} = {build_name}({sys_name}, {inter_name}, {bas_name});", nargout=0)
 
+    def batch_init(self, isotopes: Sequence[str], magnet: float, formalism: str,
+                   approximation: str, zeeman: Sequence[Optional[float]], J,
+                   empty_diagonal: bool = True):
+        """
+        Set up sys/bas/inter and build the spin system in one engine round-trip.
+
+        Equivalent to sys.isotopes/magnet, bas.formalism/approximation,
+        inter.zeeman/coupling_array and create(), but the J matrix is pushed
+        once and everything else runs as a single MATLAB eval.
+        """
+        arr = np.asarray(J, dtype=float)
+        if arr.ndim != 2 or arr.shape[0] != arr.shape[1] or arr.shape[0] != len(isotopes):
+            raise ValueError(f"J must be {len(isotopes)}x{len(isotopes)} to match isotopes; got shape {arr.shape}")
+
+        prefix = self.var_prefix
+        sys_name, inter_name, bas_name = f"{prefix}sys", f"{prefix}inter", f"{prefix}bas"
+        tmp_var = f"{prefix}J_tmp"
+
+        self.eng.workspace[tmp_var] = np_to_mat(arr)
+        self.eng.eval(
+            _isotopes_stmt(sys_name, isotopes) + "\n"
+            + _magnet_stmt(sys_name, magnet) + "\n"
+            + _formalism_stmt(bas_name, formalism) + "\n"
+            + _approximation_stmt(bas_name, approximation) + "\n"
+            + _zeeman_stmt(inter_name, zeeman) + "\n"
+            + _coupling_stmts(inter_name, tmp_var, empty_diagonal)
+            + f"clear {tmp_var};\n"
+            + f"{self.var_name} = basis(create({sys_name}, {inter_name}), {bas_name});",
+            nargout=0
+        )
+
     def liquid(self, pulse_sequence: str, assumptions: str):
         ps = pulse_sequence.strip()
         if not ps.startswith('@'):
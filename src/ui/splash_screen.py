@@ -10,10 +10,12 @@ Displays a minimalist loading screen:
 
 import sys
 import os
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PySide6.QtCore import Qt, QThread, Signal, QTimer
+from PySide6.QtCore import Qt, QThread, Signal, QTimer, QSize
 from PySide6.QtWidgets import QWidget, QVBoxLayout, QApplication, QLabel, QMessageBox
-from PySide6.QtGui import QMovie, QPixmap
+from PySide6.QtGui import QMovie, QPixmap, QImage
 
 # Add project root to path for imports
 _current_file = Path(__file__).resolve()
@@ -24,6 +26,9 @@ if str(_project_root) not in sys.path:
 # Import configuration
 from src.utils.config import config
 
+# sim.create() duration the built-in milestone schedule was timed against
+_CREATE_REFERENCE_SECONDS = 49.0
+
 
 class InitializationWorker(QThread):
     """Worker thread for background initialization"""
@@ -38,9 +43,46 @@ class InitializationWorker(QThread):
     simulation_result = None
     final_check_result = None
     
-    def __init__(self):
+    def __init__(self, create_seconds=None, scan_matlab=True):
+        """
+        Args:
+            create_seconds (float, optional): sim.create() duration measured
+                on a previous start, used to pace the progress milestones
+            scan_matlab (bool): Scan the disk for MATLAB in the background;
+                False when a configured or cached path is already known
+        """
         super().__init__()
+        self.create_seconds = create_seconds
+        self.scan_matlab = scan_matlab
         self.engine_cm = None  # Store context manager to keep engine alive
+        self._matlab_detect = None  # Future for MATLAB installation detection
+    
+    def _start_matlab_detection(self):
+        """Scan for the MATLAB installation in the background while initializing"""
+        # Disk/registry scan only; user_config is read and written by
+        # detect_matlab_info() on the GUI thread
+        from src.utils.matlab_detector import scan_matlab_installations
+        
+        executor = ThreadPoolExecutor(max_workers=1)
+        self._matlab_detect = executor.submit(scan_matlab_installations)
+        executor.shutdown(wait=False)
+    
+    def get_matlab_detection(self):
+        """
+        Get the background MATLAB detection result.
+        
+        Blocks only if detection is still running.
+        
+        Returns:
+            dict or None: {'path': Path or None} for detect_matlab_info(),
+                or None if detection was not started or failed
+        """
+        if self._matlab_detect is None:
+            return None
+        try:
+            return {'path': self._matlab_detect.result()}
+        except Exception:
+            return None
         
     def run(self):
         """Run initialization process with actual simulation test"""
@@ -52,6 +94,13 @@ class InitializationWorker(QThread):
             if parent_dir not in sys.path:
                 sys.path.insert(0, parent_dir)
             
+            # Overlap the MATLAB install scan with the phases below
+            if self.scan_matlab:
+                try:
+                    self._start_matlab_detection()
+                except Exception as e:
+                    print(f"[WARN] Background MATLAB detection not started: {e}")
+            
             # ========== Phase 1: File Integrity Check (0-10%) ==========
             self.progress.emit("Checking file integrity...")
             self.progress_percent.emit(0)
@@ -200,16 +249,23 @@ class InitializationWorker(QThread):
                             (48, 88, "Finalizing state space (16 states)..."),
                         ]
                         
+                        # Stretch the schedule to this machine's last measured create() time
+                        measured = self.create_seconds
+                        scale = measured / _CREATE_REFERENCE_SECONDS if measured else 1.0
+                        target_times = [t * scale for t, _, _ in milestones]
+                        
                         milestone_index = 0
                         while not progress_tracker['stop'] and milestone_index < len(milestones):
                             elapsed = time.time() - start_time
-                            target_time, percent, message = milestones[milestone_index]
+                            # Latest milestone reached (skips any passed during the sleep)
+                            reached = bisect_right(target_times, elapsed)
                             
-                            if elapsed >= target_time:
+                            if reached > milestone_index:
+                                _, percent, message = milestones[reached - 1]
                                 self.progress.emit(message)
                                 self.progress_percent.emit(percent)
                                 progress_tracker['percent'] = percent
-                                milestone_index += 1
+                                milestone_index = reached
                             
                             time.sleep(0.5)  # Check every 500ms
                         
@@ -225,14 +281,18 @@ class InitializationWorker(QThread):
                     # THE ACTUAL LONG OPERATION (will block for ~49 seconds)
                     # Note: MATLAB output (Running startup checks, SPINACH v2.9, etc.)
                     # will print to console but is not captured here due to GUI context
+                    create_start = time.perf_counter()
                     sim_obj.create()  # This calls create(sys, inter) and basis(spin_system, bas)
+                    create_seconds = time.perf_counter() - create_start
                     
                     # Stop progress thread and ensure we're at 90%
                     progress_tracker['stop'] = True
                     self.progress_percent.emit(90)
                     progress_tracker['percent'] = 90
                     
-                    self.simulation_result = {"status": "success", "type": "real"}
+                    # create_seconds is saved to user_config by the splash (GUI thread)
+                    self.simulation_result = {"status": "success", "type": "real",
+                                              "create_seconds": create_seconds}
                     self.progress.emit("MATLAB simulation completed successfully")
                     self.progress_percent.emit(90)
                     
@@ -378,6 +438,47 @@ class InitializationWorker(QThread):
         return "\n".join(summary_lines)
 
 
+class FrameLoader(QThread):
+    """Decode PNG sequence frames off the UI thread"""
+    # Sequence name, index of the first frame, list of decoded QImages
+    frames_ready = Signal(str, int, object)
+    
+    BATCH_SIZE = 20  # frames per signal, to keep cross-thread events few
+    
+    def __init__(self, jobs):
+        """
+        Args:
+            jobs: List of (name, frame files, fallback size) tuples; a missing
+                frame becomes a transparent image of the fallback size
+        """
+        super().__init__()
+        self.jobs = jobs
+    
+    def run(self):
+        for name, frame_files, fallback_size in self.jobs:
+            loaded_count = 0
+            batch = []
+            start = 0
+            for i, frame_file in enumerate(frame_files):
+                if self.isInterruptionRequested():
+                    return
+                # QImage (unlike QPixmap) may be created outside the GUI thread
+                image = QImage(str(frame_file))
+                if image.isNull():
+                    image = QImage(fallback_size, QImage.Format_ARGB32_Premultiplied)
+                    image.fill(Qt.transparent)
+                else:
+                    loaded_count += 1
+                batch.append(image)
+                if len(batch) == self.BATCH_SIZE:
+                    self.frames_ready.emit(name, start, batch)
+                    start = i + 1
+                    batch = []
+            if batch:
+                self.frames_ready.emit(name, start, batch)
+            print(f"Loaded {loaded_count}/{len(frame_files)} {name} frames in background")
+
+
 class SplashScreen(QWidget):
     """Minimalist splash screen with PNG sequence background and PNG spin overlay"""
     
@@ -454,6 +555,15 @@ class SplashScreen(QWidget):
         self.current_spin_frame = 0
         self._load_spin_sequence()
         
+        # Decode the remaining frames in the background; until they arrive
+        # each slot holds its sequence's first frame
+        self._frame_jobs = [job for job in (self._bg_job, self._spin_job) if job]
+        self.frame_loader = None
+        if self._frame_jobs:
+            self.frame_loader = FrameLoader(self._frame_jobs)
+            self.frame_loader.frames_ready.connect(self._on_frames_ready)
+            self.frame_loader.start()
+        
         self.init_success = False
         self.worker = None
         self.bg_frame_timer = None
@@ -462,6 +572,7 @@ class SplashScreen(QWidget):
         
     def _load_background_sequence(self):
         """Load all background PNG frames from sequence folder"""
+        self._bg_job = None
         png_folder = config.get("PNG_SEQUENCE_FOLDER", "assets/animations/Starting_Animation")
         frames_path = Path(__file__).parent.parent.parent / png_folder
         
@@ -471,22 +582,21 @@ class SplashScreen(QWidget):
         
         print(f"Loading background PNG sequence from: {frames_path}")
         
-        # Load frames: Starting_Animation_00000.png to Starting_Animation_00300.png
-        loaded_count = 0
-        for i in range(0, self.BG_TOTAL_FRAMES):
-            frame_file = frames_path / f"Starting_Animation_{i:05d}.png"
-            
-            if frame_file.exists():
-                # Use original image size (no scaling)
-                pixmap = QPixmap(str(frame_file))
-                self.bg_frames.append(pixmap)
-                loaded_count += 1
-            else:
-                empty_pixmap = QPixmap(self.background_label.size())
-                empty_pixmap.fill(Qt.transparent)
-                self.bg_frames.append(empty_pixmap)
+        # Frames: Starting_Animation_00000.png to Starting_Animation_00300.png
+        frame_files = [frames_path / f"Starting_Animation_{i:05d}.png"
+                       for i in range(0, self.BG_TOTAL_FRAMES)]
         
-        print(f"Loaded {loaded_count}/{self.BG_TOTAL_FRAMES} background PNG frames")
+        # Only the first frame is decoded here (for sizing and first paint);
+        # FrameLoader decodes the rest off the UI thread
+        first_file = frame_files[0]
+        if first_file.exists():
+            # Use original image size (no scaling)
+            first_pixmap = QPixmap(str(first_file))
+        else:
+            first_pixmap = QPixmap(self.background_label.size())
+            first_pixmap.fill(Qt.transparent)
+        self.bg_frames = [first_pixmap] * self.BG_TOTAL_FRAMES
+        self._bg_job = ("background", frame_files[1:], self.background_label.size())
         
         # Display first frame and position background label to center in window
         if self.bg_frames and not self.bg_frames[0].isNull():
@@ -508,6 +618,7 @@ class SplashScreen(QWidget):
     
     def _load_spin_sequence(self):
         """Load all spin overlay PNG frames from sequence folder"""
+        self._spin_job = None
         spin_folder = config.get("SPIN_SEQUENCE_FOLDER", "assets/animations/Spin")
         frames_path = Path(__file__).parent.parent.parent / spin_folder
         
@@ -517,22 +628,20 @@ class SplashScreen(QWidget):
         
         print(f"Loading spin PNG sequence from: {frames_path}")
         
-        # Load frames: Spin_00000.png to Spin_00059.png
-        loaded_count = 0
-        for i in range(0, self.SPIN_TOTAL_FRAMES):
-            frame_file = frames_path / f"Spin_{i:05d}.png"
-            
-            if frame_file.exists():
-                # Use original image size (no scaling)
-                pixmap = QPixmap(str(frame_file))
-                self.spin_frames.append(pixmap)
-                loaded_count += 1
-            else:
-                empty_pixmap = QPixmap(400, 400)  # Default size if image not found
-                empty_pixmap.fill(Qt.transparent)
-                self.spin_frames.append(empty_pixmap)
+        # Frames: Spin_00000.png to Spin_00059.png
+        frame_files = [frames_path / f"Spin_{i:05d}.png"
+                       for i in range(0, self.SPIN_TOTAL_FRAMES)]
         
-        print(f"Loaded {loaded_count}/{self.SPIN_TOTAL_FRAMES} spin PNG frames")
+        # First frame now, the rest in the background (see FrameLoader)
+        first_file = frame_files[0]
+        if first_file.exists():
+            # Use original image size (no scaling)
+            first_pixmap = QPixmap(str(first_file))
+        else:
+            first_pixmap = QPixmap(400, 400)  # Default size if image not found
+            first_pixmap.fill(Qt.transparent)
+        self.spin_frames = [first_pixmap] * self.SPIN_TOTAL_FRAMES
+        self._spin_job = ("spin", frame_files[1:], QSize(400, 400))
         
         # Display first frame and resize/position spin label to match image size
         if self.spin_frames and not self.spin_frames[0].isNull():
@@ -552,6 +661,24 @@ class SplashScreen(QWidget):
             self.spin_label.setPixmap(first_frame)
             print(f"Spin size: {spin_width}x{spin_height}")
         
+    def _on_frames_ready(self, name, start, images):
+        """Swap decoded background-thread frames into their sequence"""
+        frames = self.bg_frames if name == "background" else self.spin_frames
+        # Jobs skip frame 0, which was decoded in the constructor
+        start += 1
+        for offset, image in enumerate(images):
+            frames[start + offset] = QPixmap.fromImage(image)
+        
+        # Repaint if the background is currently showing a placeholder
+        if name == "background" and start <= self.current_bg_frame < start + len(images):
+            self.background_label.setPixmap(frames[self.current_bg_frame])
+    
+    def _stop_frame_loader(self):
+        """Stop background frame decoding (before the widget goes away)"""
+        if self.frame_loader is not None and self.frame_loader.isRunning():
+            self.frame_loader.requestInterruption()
+            self.frame_loader.wait()
+    
     def _center_on_screen(self):
         """Center window on screen"""
         screen = QApplication.primaryScreen().geometry()
@@ -576,7 +703,22 @@ class SplashScreen(QWidget):
     
     def _start_worker(self):
         """Actually start the initialization worker after delay"""
-        self.worker = InitializationWorker()
+        from src.utils.matlab_detector import _load_cached_matlab
+        from src.utils.user_config import get_user_config
+        user_config = get_user_config()
+        
+        # Only scan for MATLAB when neither a configured path nor a
+        # still-valid cached detection is available
+        configured_path = user_config.get_matlab_path()
+        if configured_path and os.path.isdir(configured_path):
+            scan_matlab = False
+        else:
+            scan_matlab = _load_cached_matlab() is None
+        
+        self.worker = InitializationWorker(
+            create_seconds=user_config.get_sim_create_seconds(),
+            scan_matlab=scan_matlab
+        )
         self.worker.finished.connect(self._on_init_finished)
         self.worker.progress.connect(self._on_init_progress)
         self.worker.progress_percent.connect(self._on_progress_percent)
@@ -661,6 +803,7 @@ class SplashScreen(QWidget):
         """Handle initialization completion"""
         self.init_success = success
         print(f"Initialization: {message}")
+        self._record_create_time()
         self.log_label.setText("Initialization complete" if success else "Initialization failed")
         
         # If initialization failed, show error dialog
@@ -685,6 +828,13 @@ class SplashScreen(QWidget):
             # Success - hold last frame for 2 seconds then close
             self._hold_last_frame()
     
+    def _record_create_time(self):
+        """Save the measured sim.create() time to pace the next start"""
+        result = self.worker.simulation_result if self.worker else None
+        if result and result.get("create_seconds"):
+            from src.utils.user_config import get_user_config
+            get_user_config().set_sim_create_seconds(result["create_seconds"])
+    
     def _hold_last_frame(self):
         """Hold the last frame for HOLD_DURATION milliseconds"""
         # Ensure last background frame is displayed (should be at 100%)
@@ -714,6 +864,7 @@ class SplashScreen(QWidget):
         if self.spin_frame_timer:
             self.spin_frame_timer.stop()
         
+        self._stop_frame_loader()
         event.accept()
 
 
@@ -1,16 +1,30 @@
 import os
+import re
 import json
 import csv
+from pathlib import Path
 
 PRESETS_PATH = os.path.join(os.path.dirname(__file__), 'presets')
 USER_SAVE_PATH = os.path.join(os.path.dirname(__file__), 'user_save')
 SPECTRUM_PATH = os.path.join(os.path.dirname(__file__), 'spectrum')
 
+# Whole comma/space separated integer tokens, e.g. "1, 2 3"
+_SPIN_INDEX_RE = re.compile(r'(?<![^\s,])\d+(?![^\s,])')
+
 
 from dataclasses import dataclass, asdict, field
 from typing import List, Dict, Any
 
 
+def _scan_files(folder: str) -> dict:
+    """Map file name -> DirEntry for the regular files in folder ({} if missing)."""
+    try:
+        with os.scandir(folder) as it:
+            return {e.name: e for e in it if e.is_file()}
+    except OSError:
+        return {}
+
+
 @dataclass
 class MoleculeData:
     name: str
@@ -60,12 +74,19 @@ class SaveLoad:
     def read_user_molecule(name: str, structure_path: str = None, symmetry_path: str = None) -> MoleculeData:
         """Read molecule structure and symmetry from user_save/molecules/NAME/ or any path, with input validation."""
         import warnings
+        folder = os.path.join(USER_SAVE_PATH, 'molecules', name)
+        # One readdir of the molecule folder instead of a stat per file
+        entries = _scan_files(folder)
         # Validate structure file
         if structure_path is None:
-            folder = os.path.join(USER_SAVE_PATH, 'molecules', name)
             structure_path = os.path.join(folder, 'structure.csv')
             symmetry_path = os.path.join(folder, 'symmetry.csv')
-        if not os.path.exists(structure_path):
+            has_structure = 'structure.csv' in entries
+            has_symmetry = 'symmetry.csv' in entries
+        else:
+            has_structure = os.path.exists(structure_path)
+            has_symmetry = bool(symmetry_path) and os.path.exists(symmetry_path)
+        if not has_structure:
             raise FileNotFoundError(f"Structure file not found: {structure_path}")
         with open(structure_path, 'r', encoding='utf-8') as f:
             reader = csv.reader(f)
@@ -79,23 +100,21 @@ class SaveLoad:
             raise ValueError("J coupling matrix format error, must be numeric")
         symmetry_group = []
         symmetry_spins = []
-        if symmetry_path and os.path.exists(symmetry_path):
-            with open(symmetry_path, 'r', encoding='utf-8') as f:
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2:
-                        group = row[0].strip()
-                        spins = [int(x) for x in row[1].replace(',', ' ').split() if x.strip().isdigit()]
-                        symmetry_group.append(group)
-                        symmetry_spins.append(spins)
+        if has_symmetry:
+            # Tiny file: read it whole and split "GROUP,SPINS" lines by hand
+            for line in Path(symmetry_path).read_text(encoding='utf-8').splitlines():
+                parts = line.split(',', 1)
+                if len(parts) == 2:
+                    group = parts[0].strip().strip('"')
+                    spins = list(map(int, _SPIN_INDEX_RE.findall(parts[1].strip().strip('"'))))
+                    symmetry_group.append(group)
+                    symmetry_spins.append(spins)
         else:
             warnings.warn(f"Symmetry file not found: {symmetry_path}")
         # Read information.txt
         information = None
-        folder = os.path.join(USER_SAVE_PATH, 'molecules', name)
-        info_path = os.path.join(folder, 'information.txt')
-        if os.path.exists(info_path):
-            with open(info_path, 'r', encoding='utf-8') as f:
+        if 'information.txt' in entries:
+            with open(entries['information.txt'].path, 'r', encoding='utf-8') as f:
                 information = f.read()
         return MoleculeData(name=name, isotopes=isotopes, J_coupling=J_coupling, symmetry_group=symmetry_group, symmetry_spins=symmetry_spins, information=information)
 
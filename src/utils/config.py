@@ -8,6 +8,9 @@ import os
 from pathlib import Path
 
 
+_CONFIG_FILE = Path(__file__).resolve().parents[2] / 'config.txt'
+
+
 class Config:
     """Application configuration singleton"""
     
@@ -22,7 +25,7 @@ class Config:
     
     def _load_config(self):
         """Load configuration from config.txt"""
-        config_path = Path(__file__).parent.parent.parent / 'config.txt'
+        config_path = _CONFIG_FILE
         
         if not config_path.exists():
             print(f"Warning: Config file not found at {config_path}")
@@ -4,9 +4,16 @@ Configuration Applier Module
 Handles application of user configuration choices from startup dialog.
 """
 
+import os
+import subprocess
 from pathlib import Path
 from .matlab_detector import get_matlab_version
 from .matlab_installer import install_matlab_engine
+from .user_config import get_user_config
+
+
+# Project root (src/utils -> root)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
 def apply_user_config(startup_config):
@@ -35,9 +42,6 @@ def apply_user_config(startup_config):
             'matlab_engine_installed': bool  # True if MATLAB Engine was installed
         }
     """
-    from .user_config import get_user_config
-    
-    workspace_root = Path(__file__).parent.parent.parent
     user_config = get_user_config()
     
     results = {
@@ -45,21 +49,35 @@ def apply_user_config(startup_config):
         'matlab_engine_installed': False
     }
     
-    # Mark first run as complete
-    if user_config.is_first_run():
-        user_config.mark_first_run_complete()
-        print("First run setup completed")
-    
-    # Save user preferences
     use_matlab = startup_config.get('use_matlab', False) and not startup_config.get('skip_matlab', False)
     execution_mode = startup_config.get('execution', 'local')
     
-    user_config.set_preferences(
-        use_matlab=use_matlab,
-        execution_mode=execution_mode
+    # First-run flag and preferences go to disk in one write
+    with user_config.batch():
+        # Mark first run as complete
+        if user_config.is_first_run():
+            user_config.mark_first_run_complete()
+            print("First run setup completed")
+        
+        # Save user preferences
+        preferences = user_config.get_preferences()
+        if (preferences.get('use_matlab') != use_matlab
+                or preferences.get('execution_mode') != execution_mode):
+            user_config.set_preferences(
+                use_matlab=use_matlab,
+                execution_mode=execution_mode
+            )
+            print(f"User preferences saved: use_matlab={use_matlab}, execution_mode={execution_mode}")
+    
+    # Nothing to install - skip the Spinach/MATLAB Engine setup paths
+    needs_work = any(
+        startup_config.get(key)
+        for key in ('configure_embedded_spinach', 'configure_matlab_engine')
     )
+    if not needs_work:
+        return results
     
-    print(f"User preferences saved: use_matlab={use_matlab}, execution_mode={execution_mode}")
+    workspace_root = _PROJECT_ROOT
     
     # Configure embedded Spinach if requested
     if startup_config.get('configure_embedded_spinach'):
@@ -85,8 +103,6 @@ def configure_embedded_spinach(workspace_root, user_config):
         workspace_root (Path): Project root directory
         user_config: User configuration manager
     """
-    import subprocess
-    
     spinach_script = workspace_root / "environments" / "spinach" / "setup_spinach.ps1"
     
     if not spinach_script.exists():
@@ -97,7 +113,7 @@ def configure_embedded_spinach(workspace_root, user_config):
     
     try:
         subprocess.run(
-            ["powershell", "-ExecutionPolicy", "Bypass", "-File", str(spinach_script)],
+            ["powershell", "-ExecutionPolicy", "Bypass", "-File", os.fspath(spinach_script)],
             check=False
         )
         
@@ -182,9 +198,8 @@ def configure_matlab_engine(matlab_path, workspace_root, user_config):
         print(f"MATLAB configuration saved: {matlab_version} at {matlab_path}")
     else:
         print(f"\n[ERROR] MATLAB Engine installation failed:")
+        # setup.py output was already echoed while the installer ran
         if install_result['error']:
             print(f"  {install_result['error']}")
-        if install_result['stderr']:
-            print(f"  Details: {install_result['stderr']}")
     
     return result
@@ -15,6 +15,7 @@ This does NOT activate environments - that's done by the launcher scripts.
 
 import os
 import sys
+import json
 import subprocess
 from pathlib import Path
 from typing import Optional, Dict, List, Tuple
@@ -252,6 +253,36 @@ class PythonEnvironment:
         except Exception:
             return False
     
+    def are_packages_installed(self, packages: List[str]) -> Dict[str, bool]:
+        """
+        Check several packages with a single interpreter launch.
+        
+        Packages are located with importlib.util.find_spec, so nothing is
+        imported (and no Qt/numpy start-up cost is paid) in the child.
+        
+        Args:
+            packages: Top-level package names (e.g., ['PySide6', 'numpy'])
+        
+        Returns:
+            Dict mapping each package name to True if installed
+        """
+        script = (
+            "import importlib.util, json, sys; "
+            "print(json.dumps({n: importlib.util.find_spec(n) is not None for n in sys.argv[1:]}))"
+        )
+        try:
+            result = self.run_command(
+                '-c', script, *packages,
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode == 0:
+                return json.loads(result.stdout)
+        except Exception:
+            pass
+        return {package: False for package in packages}
+    
     def install_package(self, package: str, upgrade: bool = False) -> Tuple[bool, str]:
         """
         Install a package using pip.
@@ -10,13 +10,72 @@ Please use the following modules instead:
 This file now serves as a compatibility wrapper.
 """
 
+import functools
+import os
 import sys
 import subprocess
 from pathlib import Path
 
 # Import from new modular structure
-from .matlab_detector import auto_detect_matlab
+from .matlab_detector import auto_detect_matlab, get_matlab_version, is_matlab_release
 from .config_applier import apply_user_config
+from .matlab_installer import install_matlab_engine
+from .user_config import get_user_config
+
+
+# Project root (src/utils -> root)
+_PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# python.exe path -> result of the matlab.engine probe
+_engine_probe_cache = {}
+
+
+def _probe_matlab_engine(python_exe):
+    """
+    Check whether MATLAB Engine can be imported by the embedded Python.
+    
+    Skips the interpreter launch when the package files are missing or a
+    previous successful check was recorded for the same python.exe.
+    
+    Args:
+        python_exe (Path): Embedded Python executable
+        
+    Returns:
+        bool: True if matlab.engine imports successfully
+    """
+    engine_marker = python_exe.parent / "Lib" / "site-packages" / "matlab" / "engine" / "__init__.py"
+    if not engine_marker.exists():
+        return False
+    
+    cache_key = os.fspath(python_exe)
+    if cache_key in _engine_probe_cache:
+        return _engine_probe_cache[cache_key]
+    
+    user_config = get_user_config()
+    
+    python_exe_mtime = os.stat(python_exe).st_mtime
+    if user_config.get_engine_verification()['python_exe_mtime'] == python_exe_mtime:
+        _engine_probe_cache[cache_key] = True
+        return True
+    
+    # The marker file already shows the package is there; only a real
+    # import tells whether it works with this interpreter
+    try:
+        check_result = subprocess.run(
+            [cache_key, "-c", "import matlab.engine; print('OK')"],
+            capture_output=True,
+            text=True,
+            timeout=30
+        )
+        engine_ok = check_result.returncode == 0 and "OK" in check_result.stdout
+    except (OSError, subprocess.TimeoutExpired):
+        engine_ok = False
+    
+    _engine_probe_cache[cache_key] = engine_ok
+    if engine_ok:
+        user_config.set_engine_verification(python_exe_mtime)
+    
+    return engine_ok
 
 
 def auto_configure_first_run():
@@ -33,7 +92,7 @@ def auto_configure_first_run():
             'matlab_version': str or None
         }
     """
-    workspace_root = Path(__file__).parent.parent.parent
+    workspace_root = _PROJECT_ROOT
     
     print("\n" + "="*70)
     print("ZULF-NMR Suite - First Run Auto-Configuration")
@@ -71,34 +130,18 @@ def auto_configure_first_run():
     
     # Step 3: Auto-detect MATLAB installation
     print("\n[3/4] Detecting MATLAB installation...")
-    matlab_path = auto_detect_matlab()
+    matlab_path = auto_detect_matlab(force=True)
     
     if matlab_path:
         print(f"  ✓ Found MATLAB: {matlab_path}")
         results['matlab_detected'] = True
         results['matlab_path'] = matlab_path
         
-        # Detect MATLAB version
-        version_info_file = matlab_path / "VersionInfo.xml"
-        if version_info_file.exists():
-            try:
-                import xml.etree.ElementTree as ET
-                tree = ET.parse(version_info_file)
-                root = tree.getroot()
-                release = root.find('.//release')
-                if release is not None and release.text:
-                    results['matlab_version'] = release.text.strip()
-                    print(f"  ✓ Version: {results['matlab_version']}")
-            except Exception:
-                # Try to get version from path
-                if matlab_path.name.startswith('R20'):
-                    results['matlab_version'] = matlab_path.name
-                else:
-                    results['matlab_version'] = "Unknown"
-        elif matlab_path.name.startswith('R20'):
-            results['matlab_version'] = matlab_path.name
-        else:
-            results['matlab_version'] = "Unknown"
+        # Detect MATLAB version (fall back to the folder name, e.g. R2024a)
+        results['matlab_version'] = get_matlab_version(matlab_path) or (
+            matlab_path.name if is_matlab_release(matlab_path.name) else "Unknown"
+        )
+        print(f"  ✓ Version: {results['matlab_version']}")
     else:
         print("  ✗ MATLAB not found")
         print("  Pure Python mode will be used")
@@ -108,50 +151,32 @@ def auto_configure_first_run():
     print("\n[4/4] Configuring MATLAB Engine...")
     
     # Check if already installed
-    check_result = subprocess.run(
-        [str(python_exe), "-c", "import matlab.engine; print('OK')"],
-        capture_output=True,
-        text=True
-    )
-    
-    if check_result.returncode == 0 and "OK" in check_result.stdout:
+    if _probe_matlab_engine(python_exe):
         print("  ✓ MATLAB Engine already installed")
         results['matlab_engine_installed'] = True
     else:
-        # Install MATLAB Engine
-        matlab_setup = matlab_path / "extern" / "engines" / "python" / "setup.py"
+        # Install MATLAB Engine (prebuilt wheel when the release has one)
+        install_result = install_matlab_engine(
+            matlab_path, python_exe, matlab_version=results['matlab_version']
+        )
         
-        if matlab_setup.exists():
-            print(f"  Installing MATLAB Engine from: {matlab_setup}")
-            print("  This may take a few minutes...")
-            
-            install_result = subprocess.run(
-                [str(python_exe), str(matlab_setup), "install"],
-                capture_output=True,
-                text=True
-            )
-            
-            if install_result.returncode == 0:
-                print("  ✓ MATLAB Engine installed successfully!")
-                results['matlab_engine_installed'] = True
-            else:
-                print("  ✗ MATLAB Engine installation failed:")
-                print(install_result.stderr[:500])  # Show first 500 chars of error
+        if install_result['success']:
+            print("  ✓ MATLAB Engine installed successfully!")
+            results['matlab_engine_installed'] = True
         else:
-            print(f"  ✗ MATLAB Engine setup.py not found: {matlab_setup}")
+            print(f"  ✗ MATLAB Engine installation failed: {install_result['error']}")
     
     # Save configuration
     if results['matlab_detected'] and results['matlab_engine_installed']:
-        from .user_config import get_user_config
         user_config = get_user_config()
         
-        user_config.set_matlab_config(
-            matlab_path=str(matlab_path),
-            version=results['matlab_version'],
-            engine_installed=True
-        )
-        
-        user_config.set_preferences(use_matlab=True, execution_mode='local')
+        with user_config.batch():
+            user_config.set_matlab_config(
+                matlab_path=str(matlab_path),
+                version=results['matlab_version'],
+                engine_installed=True
+            )
+            user_config.set_preferences(use_matlab=True, execution_mode='local')
         print(f"\n✓ Configuration saved to user_config.json")
     
     print("\n" + "="*70)
@@ -161,11 +186,17 @@ def auto_configure_first_run():
     return results
 
 
+@functools.lru_cache(maxsize=1)
 def check_first_run():
-    """Check if this is the first run and needs setup."""
+    """
+    Check if this is the first run and needs setup.
     
-    # Get workspace root (src/utils -> root)
-    workspace_root = Path(__file__).parent.parent.parent
+    The probe result is cached for the process; call
+    check_first_run.cache_clear() after changing the setup markers.
+    Treat the returned dict as read-only.
+    """
+    
+    workspace_root = _PROJECT_ROOT
     
     # Check markers
     python_ready = (workspace_root / "environments" / "python" / "python.exe").exists()
@@ -184,20 +215,54 @@ def check_first_run():
     }
 
 
-def show_first_run_dialog():
+def _display_available():
+    """Check whether a GUI dialog can actually be shown."""
+    if os.environ.get('QT_QPA_PLATFORM') == 'offscreen':
+        return False
+    return sys.stdout.isatty() or 'DISPLAY' in os.environ or sys.platform == 'win32'
+
+
+def _print_first_run_warning():
+    """Print the first-run warning for headless / no-PySide6 sessions."""
+    print("=" * 60)
+    print("WARNING: Embedded Python Not Found!")
+    print("=" * 60)
+    print()
+    print("Please run: environments\\python\\setup_embedded_python.ps1")
+    print("Or continue with system Python (not recommended)")
+    print()
+
+
+def show_first_run_dialog(gui=False):
     """
     Show first-run setup dialog.
     
+    Only call this after check_first_run() reports 'first_run'. Without a
+    display the text warning is printed and PySide6 is never imported.
+    
+    Args:
+        gui (bool): Allow creating a QApplication when none exists yet.
+            Without it the dialog is only shown inside a running Qt app
+            and the text warning is printed otherwise.
+    
     Returns:
         str: 'setup' = run Python setup script (should not happen if Python exists)
              'skip' = skip setup (continue with current state)
     """
+    if not _display_available():
+        _print_first_run_warning()
+        return 'skip'
     
     try:
-        from PySide6.QtWidgets import QApplication, QMessageBox, QPushButton
-        from PySide6.QtCore import Qt
+        from PySide6.QtWidgets import QApplication, QMessageBox
         
-        app = QApplication.instance() or QApplication(sys.argv)
+        # A QMessageBox needs a QApplication; reuse the caller's instance
+        # and only pay for a full Qt init when explicitly asked to
+        if QApplication.instance() is None:
+            if not gui:
+                _print_first_run_warning()
+                return 'skip'
+            _app = QApplication(sys.argv)
         
         msg = QMessageBox()
         msg.setWindowTitle("Setup Required")
@@ -226,13 +291,7 @@ def show_first_run_dialog():
             
     except ImportError:
         # PySide6 not available, skip GUI
-        print("=" * 60)
-        print("WARNING: Embedded Python Not Found!")
-        print("=" * 60)
-        print()
-        print("Please run: environments\\python\\setup_embedded_python.ps1")
-        print("Or continue with system Python (not recommended)")
-        print()
+        _print_first_run_warning()
         return 'skip'
 
 
@@ -242,10 +301,7 @@ def show_first_run_dialog():
 def run_setup_wizard():
     """Run the setup wizard."""
     
-    import subprocess
-    from pathlib import Path
-    
-    workspace_root = Path(__file__).parent.parent.parent
+    workspace_root = _PROJECT_ROOT
     
     print("\n=== ZULF-NMR Suite Setup Wizard ===\n")
     
@@ -256,7 +312,7 @@ def run_setup_wizard():
     if python_script.exists():
         try:
             subprocess.run(
-                ["powershell", "-ExecutionPolicy", "Bypass", "-File", str(python_script)],
+                ["powershell", "-ExecutionPolicy", "Bypass", "-File", os.fspath(python_script)],
                 check=False
             )
         except Exception as e:
@@ -271,7 +327,7 @@ def run_setup_wizard():
         if response == 'y':
             try:
                 subprocess.run(
-                    ["powershell", "-ExecutionPolicy", "Bypass", "-File", str(spinach_script)],
+                    ["powershell", "-ExecutionPolicy", "Bypass", "-File", os.fspath(spinach_script)],
                     check=False
                 )
             except Exception as e:
@@ -281,6 +337,7 @@ def run_setup_wizard():
     
     # Mark setup complete
     (workspace_root / ".setup_complete").touch()
+    check_first_run.cache_clear()
     
     print("\n[OK] Setup complete!")
     print("Restart the application to begin.\n")
@@ -290,8 +347,10 @@ if __name__ == "__main__":
     status = check_first_run()
     
     if status['first_run']:
-        if show_first_run_dialog():
+        # Dialog (and the PySide6 import) only happens when setup is needed
+        if show_first_run_dialog(gui=True) == 'setup':
             run_setup_wizard()
         else:
             # User skipped, mark as complete anyway
-            (Path(__file__).parent.parent.parent / ".setup_complete").touch()
+            (_PROJECT_ROOT / ".setup_complete").touch()
+            check_first_run.cache_clear()
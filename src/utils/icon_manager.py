@@ -4,102 +4,138 @@ Icon Manager for Application
 Handles loading and caching of application icons
 """
 
-import sys
+import os
 from pathlib import Path
 from PySide6.QtGui import QIcon, QPixmap
-from PySide6.QtCore import QSize
 
 from src.utils.config import config
 
 
 class IconManager:
-    """Manages application icons with fallback support"""
+    """
+    Manages application icons with fallback support
     
-    _instance = None
+    All state lives on the class and every method is a classmethod, so
+    there is no per-call singleton check; IconManager() still works.
+    """
+    
+    project_root = Path(__file__).resolve().parents[2]
+    icons_dir = project_root / "assets" / "icons"
     _icon_cache = {}
+    _asset_index = None
+    
+    @classmethod
+    def _scan_icons(cls):
+        """Index assets/icons once so icon lookups don't hit the disk"""
+        asset_index = {}
+        try:
+            with os.scandir(cls.icons_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        asset_index[entry.name] = Path(entry.path)
+        except OSError:
+            pass
+        # Publish the finished index in one assignment
+        cls._asset_index = asset_index
+        return asset_index
     
-    def __new__(cls):
-        """Singleton pattern"""
-        if cls._instance is None:
-            cls._instance = super().__new__(cls)
-            cls._instance._initialized = False
-        return cls._instance
+    @classmethod
+    def _get_asset_index(cls):
+        """Get the assets/icons index, scanning on first use"""
+        asset_index = cls._asset_index
+        if asset_index is None:
+            asset_index = cls._scan_icons()
+        return asset_index
     
-    def __init__(self):
-        """Initialize icon manager"""
-        if self._initialized:
-            return
+    @classmethod
+    def _find_asset(cls, relative_path):
+        """
+        Resolve an asset path relative to the project root
+        
+        Args:
+            relative_path: Path relative to the project root
         
-        self.project_root = Path(__file__).parent.parent.parent
-        self._initialized = True
+        Returns:
+            Path or None: Asset file if it exists
+        """
+        asset_file = cls.project_root / relative_path
+        if asset_file.parent == cls.icons_dir:
+            return cls._get_asset_index().get(asset_file.name)
+        # Configured outside assets/icons - not indexed
+        return asset_file if asset_file.exists() else None
     
-    def get_app_icon(self) -> QIcon:
+    @classmethod
+    def get_app_icon(cls) -> QIcon:
         """
         Get main application icon
         
         Returns:
             QIcon: Application icon (or empty icon if not found)
         """
-        if 'app_icon' in self._icon_cache:
-            return self._icon_cache['app_icon']
+        if 'app_icon' in cls._icon_cache:
+            return cls._icon_cache['app_icon']
         
         icon = QIcon()
         
-        # Try ICO first (Windows native, multi-resolution)
+        # Try ICO first (Windows native, multi-resolution).
+        # The assets/icons index answers which file exists without
+        # stat'ing each candidate path.
         ico_path = config.get('APP_ICON', 'assets/icons/app_icon.ico')
-        ico_file = self.project_root / ico_path
+        ico_file = cls._find_asset(ico_path)
         
-        if ico_file.exists():
+        if ico_file:
             icon = QIcon(str(ico_file))
-            self._icon_cache['app_icon'] = icon
+            cls._icon_cache['app_icon'] = icon
             return icon
         
         # Fallback to PNG
         png_path = config.get('APP_ICON_PNG', 'assets/icons/app_icon.png')
-        png_file = self.project_root / png_path
+        png_file = cls._find_asset(png_path)
         
-        if png_file.exists():
+        if png_file:
             icon = QIcon(str(png_file))
-            self._icon_cache['app_icon'] = icon
+            cls._icon_cache['app_icon'] = icon
             return icon
         
         # No icon found - return empty icon (app will use system default)
-        print(f"Warning: Application icon not found at {ico_file} or {png_file}")
+        print(f"Warning: Application icon not found at {cls.project_root / ico_path} or {cls.project_root / png_path}")
         print("Using system default icon. See assets/icons/README.md for icon setup guide.")
         
-        self._icon_cache['app_icon'] = icon
+        cls._icon_cache['app_icon'] = icon
         return icon
     
-    def get_splash_logo(self) -> QPixmap:
+    @classmethod
+    def get_splash_logo(cls) -> QPixmap:
         """
         Get splash screen logo
         
         Returns:
             QPixmap: Logo pixmap (or null pixmap if not found)
         """
-        if 'splash_logo' in self._icon_cache:
-            return self._icon_cache['splash_logo']
+        if 'splash_logo' in cls._icon_cache:
+            return cls._icon_cache['splash_logo']
         
         logo_path = config.get('SPLASH_LOGO', 'assets/icons/splash_logo.png')
-        logo_file = self.project_root / logo_path
         
-        pixmap = QPixmap()
+        # QPixmap loads eagerly, so a failed load (null pixmap) already
+        # tells us the file is missing - no separate exists() check
+        pixmap = QPixmap(str(cls.project_root / logo_path))
         
-        if logo_file.exists():
-            pixmap = QPixmap(str(logo_file))
+        if not pixmap.isNull():
             # Scale to reasonable size if too large
             if pixmap.width() > 256 or pixmap.height() > 256:
                 pixmap = pixmap.scaled(256, 256, 
                                       aspectRatioMode=1,  # Qt.KeepAspectRatio
                                       transformMode=1)    # Qt.SmoothTransformation
         else:
-            print(f"Info: Splash logo not found at {logo_file}")
+            print(f"Info: Splash logo not found at {cls.project_root / logo_path}")
             print("Splash screen will display without logo.")
         
-        self._icon_cache['splash_logo'] = pixmap
+        cls._icon_cache['splash_logo'] = pixmap
         return pixmap
     
-    def get_icon(self, name: str, size: int = 24) -> QIcon:
+    @classmethod
+    def get_icon(cls, name: str, size: int = 24) -> QIcon:
         """
         Get a named icon from assets/icons directory
         
@@ -112,28 +148,29 @@ class IconManager:
         """
         cache_key = f"{name}_{size}"
         
-        if cache_key in self._icon_cache:
-            return self._icon_cache[cache_key]
+        if cache_key in cls._icon_cache:
+            return cls._icon_cache[cache_key]
         
         icon = QIcon()
         
-        # Try to find icon file with size suffix
-        icon_file = self.project_root / "assets" / "icons" / f"{name}_{size}.png"
-        
-        if not icon_file.exists():
-            # Try without size suffix
-            icon_file = self.project_root / "assets" / "icons" / f"{name}.png"
+        # Try to find icon file with size suffix, then without
+        asset_index = cls._get_asset_index()
+        icon_file = (asset_index.get(f"{name}_{size}.png")
+                     or asset_index.get(f"{name}.png"))
         
-        if icon_file.exists():
+        if icon_file:
             icon = QIcon(str(icon_file))
         
-        self._icon_cache[cache_key] = icon
+        cls._icon_cache[cache_key] = icon
         return icon
     
-    def clear_cache(self):
+    @classmethod
+    def clear_cache(cls):
         """Clear icon cache (useful for hot-reloading icons during development)"""
-        self._icon_cache.clear()
+        cls._icon_cache.clear()
+        cls._scan_icons()
 
 
-# Global instance
-icon_manager = IconManager()
+# Global accessor (the class itself - all methods are classmethods).
+# Importing it does no work: assets/icons is scanned on the first lookup.
+icon_manager = IconManager
@@ -4,40 +4,139 @@ MATLAB Detection Module
 Provides utilities for detecting MATLAB installations on the system.
 """
 
+import atexit
+import functools
 import os
+import re
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+try:
+    import winreg
+except ImportError:  # Not on Windows
+    winreg = None
 
-def auto_detect_matlab():
+from .user_config import get_user_config
+
+
+_RELEASE_PATTERN = re.compile(rb'<release>\s*([^<\s]+)\s*</release>')
+
+# MATLAB release folder names, e.g. R2024a / R2023b
+_MATLAB_VERSION_RE = re.compile(r'R20\d\d[ab]', re.IGNORECASE)
+
+
+def is_matlab_release(name):
+    """
+    Check whether a string is a MATLAB release name.
+    
+    Args:
+        name (str): Candidate such as a folder name or saved version
+    
+    Returns:
+        bool: True for names like 'R2024a' or 'r2023B'
+    """
+    return _MATLAB_VERSION_RE.fullmatch(name) is not None
+
+
+def auto_detect_matlab(force=False):
     """
     Automatically detect MATLAB installation on Windows.
     
     Searches in common installation directories and Windows registry.
+    The result is cached in user_config.json and reused while the cached
+    bin/matlab.exe is unchanged.
+    
+    Args:
+        force (bool): Ignore the cached result and rescan
     
     Returns:
         Path or None: Path to MATLAB installation directory if found, None otherwise
     """
-    matlab_installations = []
+    if not force:
+        cached_path = _load_cached_matlab()
+        if cached_path:
+            return cached_path
+    
+    newest = scan_matlab_installations()
+    if newest is not None:
+        cache_detected_matlab(newest)
+    
+    return newest
+
+
+def scan_matlab_installations():
+    """
+    Scan common installation directories and the registry for MATLAB.
+    
+    Unlike auto_detect_matlab() this neither reads nor writes
+    user_config.json, so it is safe to run off the GUI thread.
+    
+    Returns:
+        Path or None: Newest MATLAB installation directory, None if none found
+    """
+    # A set drops installations found by both methods
+    matlab_installations: set[Path] = set()
     
     # Method 1: Check common installation directories
-    matlab_installations.extend(_check_common_paths())
+    matlab_installations.update(_check_common_paths())
     
     # Method 2: Check Windows registry
-    matlab_installations.extend(_check_windows_registry())
+    matlab_installations.update(_check_windows_registry())
+    
+    # Return the newest version by directory name (R2024a > R2023b > R2021a),
+    # preferring release-named folders over anything else. The full path
+    # breaks ties between same-named folders under different roots, so the
+    # result does not depend on set iteration order.
+    newest = max(
+        matlab_installations,
+        key=lambda p: (is_matlab_release(p.name), p.name, str(p)),
+        default=None
+    )
+    return newest
+
+
+def _load_cached_matlab():
+    """
+    Return the cached MATLAB path if its matlab.exe is still unchanged.
+    
+    Returns:
+        Path or None: Cached MATLAB installation directory, None on miss
+    """
+    cached = get_user_config().get_matlab_cache()
+    if not cached or not cached.get('path'):
+        return None
+    
+    matlab_path = Path(cached['path'])
+    try:
+        mtime = os.stat(matlab_path / "bin" / "matlab.exe").st_mtime
+    except OSError:
+        return None
+    
+    return matlab_path if mtime == cached.get('mtime') else None
+
+
+def cache_detected_matlab(matlab_path):
+    """
+    Cache a detected MATLAB path in user_config.json.
     
-    # Return the newest version (last in sorted list)
-    if matlab_installations:
-        # Sort by directory name (R2024a > R2023b > R2021a)
-        matlab_installations.sort(key=lambda p: p.name, reverse=True)
-        return matlab_installations[0]
+    Args:
+        matlab_path (Path): Detected MATLAB installation directory
+    """
+    try:
+        mtime = os.stat(matlab_path / "bin" / "matlab.exe").st_mtime
+    except OSError:
+        return
     
-    return None
+    get_user_config().set_matlab_cache(matlab_path, mtime)
 
 
 def _check_common_paths():
     """
     Check common MATLAB installation paths.
     
+    The base paths live on different drives, so they are probed
+    concurrently rather than one after another.
+    
     Returns:
         list[Path]: List of found MATLAB installation directories
     """
@@ -50,67 +149,100 @@ def _check_common_paths():
         r"C:\MATLAB"
     ]
     
-    matlab_installations = []
+    with ThreadPoolExecutor(max_workers=len(common_paths)) as executor:
+        results = executor.map(_probe_one_base, common_paths)
+    
+    return [path for found in results for path in found]
+
+
+def _probe_one_base(base_path):
+    """
+    Look for MATLAB installations under one base directory.
     
-    for base_path in common_paths:
-        base = Path(base_path)
-        if not base.exists():
-            continue
+    Args:
+        base_path (str): Base directory to probe
         
-        # Check if it's a direct MATLAB installation (has bin/matlab.exe)
-        if (base / "bin" / "matlab.exe").exists():
-            matlab_installations.append(base)
-        else:
-            # Check subdirectories for version folders (R2024a, R2023b, etc.)
-            try:
-                for subdir in base.iterdir():
-                    if subdir.is_dir() and (subdir / "bin" / "matlab.exe").exists():
-                        matlab_installations.append(subdir)
-            except PermissionError:
-                continue
+    Returns:
+        list[Path]: MATLAB installation directories found under base_path
+    """
+    base = Path(base_path)
+    if not base.exists():
+        return []
+    
+    # Check if it's a direct MATLAB installation (has bin/matlab.exe)
+    if (base / "bin" / "matlab.exe").exists():
+        return [base]
+    
+    # Check subdirectories for version folders (R2024a, R2023b, etc.)
+    matlab_installations = []
+    try:
+        # DirEntry.is_dir() reuses the directory listing data, so only the
+        # matlab.exe check needs its own stat call
+        with os.scandir(base) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if os.path.isfile(os.path.join(entry.path, "bin", "matlab.exe")):
+                        matlab_installations.append(Path(entry.path))
+    except (PermissionError, OSError):
+        pass
     
     return matlab_installations
 
 
+@functools.lru_cache(maxsize=None)
+def _open_registry_key(hive, subkey):
+    """
+    Open a registry key once per process and close it at interpreter exit.
+    
+    Args:
+        hive: winreg hive constant (e.g. winreg.HKEY_LOCAL_MACHINE)
+        subkey (str): Key path below the hive
+        
+    Returns:
+        winreg.HKEYType: Open key handle
+    """
+    key = winreg.OpenKey(hive, subkey, 0, winreg.KEY_READ | winreg.KEY_WOW64_64KEY)
+    atexit.register(winreg.CloseKey, key)
+    return key
+
+
 def _check_windows_registry():
     """
     Check Windows registry for MATLAB installations.
     
     Returns:
-        list[Path]: List of found MATLAB installation directories
+        frozenset[Path]: Found MATLAB installation directories
     """
-    matlab_installations = []
+    matlab_installations: set[Path] = set()
+    
+    if winreg is None:
+        return frozenset()
     
     try:
-        import winreg
-        reg_key = winreg.OpenKey(
-            winreg.HKEY_LOCAL_MACHINE, 
-            r"SOFTWARE\MathWorks\MATLAB", 
-            0, 
-            winreg.KEY_READ
-        )
+        reg_key = _open_registry_key(winreg.HKEY_LOCAL_MACHINE, r"SOFTWARE\MathWorks\MATLAB")
+        
+        # Size the enumeration up front instead of probing until OSError
+        num_subkeys, _, _ = winreg.QueryInfoKey(reg_key)
         
-        try:
-            i = 0
-            while True:
-                try:
-                    version_key_name = winreg.EnumKey(reg_key, i)
-                    version_key = winreg.OpenKey(reg_key, version_key_name)
-                    matlab_root, _ = winreg.QueryValueEx(version_key, "MATLABROOT")
-                    winreg.CloseKey(version_key)
-                    
-                    matlab_path = Path(matlab_root)
-                    if matlab_path.exists() and matlab_path not in matlab_installations:
-                        matlab_installations.append(matlab_path)
-                    i += 1
-                except OSError:
-                    break
-        finally:
-            winreg.CloseKey(reg_key)
-    except (ImportError, FileNotFoundError, OSError):
+        for i in range(num_subkeys):
+            try:
+                version_key_name = winreg.EnumKey(reg_key, i)
+                with winreg.OpenKey(reg_key, version_key_name) as version_key:
+                    matlab_root, value_type = winreg.QueryValueEx(version_key, "MATLABROOT")
+            except OSError:
+                continue
+            
+            # Only string values can hold an installation path
+            if value_type not in (winreg.REG_SZ, winreg.REG_EXPAND_SZ):
+                continue
+            
+            matlab_path = Path(matlab_root)
+            if matlab_path.exists():
+                matlab_installations.add(matlab_path)
+    except OSError:
         pass
     
-    return matlab_installations
+    return frozenset(matlab_installations)
 
 
 def get_matlab_version(matlab_path):
@@ -124,20 +256,15 @@ def get_matlab_version(matlab_path):
         str or None: MATLAB version string (e.g., "R2024a"), None if not found
     """
     version_info_file = Path(matlab_path) / "VersionInfo.xml"
-    if not version_info_file.exists():
-        return None
     
     try:
-        import xml.etree.ElementTree as ET
-        tree = ET.parse(version_info_file)
-        root = tree.getroot()
-        release = root.find('.//release')
-        if release is not None and release.text:
-            return release.text.strip()
-    except Exception:
-        pass
+        data = version_info_file.read_bytes()
+    except OSError:
+        return None
     
-    return None
+    # <release> sits near the top of a small file - no need for a full DOM
+    match = _RELEASE_PATTERN.search(data)
+    return match.group(1).decode() if match else None
 
 
 def verify_matlab_installation(matlab_path):
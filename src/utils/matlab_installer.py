@@ -4,24 +4,132 @@ MATLAB Engine Installer Module
 Provides utilities for installing MATLAB Engine to Python environments.
 """
 
+import importlib
+import importlib.util
+import os
 import subprocess
+import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from .matlab_detector import get_matlab_version, is_matlab_release
 
-def install_matlab_engine(matlab_path, python_executable):
+
+# Lines of child output kept for error reporting
+OUTPUT_TAIL_LINES = 200
+
+# pip settings for the prebuilt wheel, so an offline machine fails fast
+PIP_INSTALL_OPTIONS = ["--retries", "1", "--timeout", "15"]
+
+
+def run_streamed(cmd, timeout=None):
+    """
+    Run a command, echoing its output line by line as it arrives.
+    
+    stderr is merged into stdout and read continuously, so a chatty child
+    can never block on a full pipe and memory stays bounded.
+    
+    Args:
+        cmd (list): Command line to execute
+        timeout (float or None): Seconds before the child is killed
+        
+    Returns:
+        tuple: (returncode, output) where output is the last
+            OUTPUT_TAIL_LINES lines of combined stdout/stderr
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout
+    """
+    tail = deque(maxlen=OUTPUT_TAIL_LINES)
+    # A terminal shows lines as they are written; a pipe or log file
+    # (launcher scripts, CI) needs a flush per line to show progress
+    isatty = getattr(sys.stdout, 'isatty', None)
+    flush_each = not (isatty and isatty())
+    
+    with subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        text=True,
+        bufsize=1
+    ) as proc:
+        # The deadline is enforced by a timer, not the read loop, so a
+        # child that hangs without printing is still killed
+        timed_out = threading.Event()
+        
+        def kill_on_timeout():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, kill_on_timeout) if timeout is not None else None
+        if timer:
+            timer.daemon = True
+            timer.start()
+        try:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                if flush_each:
+                    sys.stdout.flush()
+                tail.append(line)
+            returncode = proc.wait()
+        finally:
+            if timer:
+                timer.cancel()
+            sys.stdout.flush()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout, output=''.join(tail))
+    
+    return returncode, ''.join(tail)
+
+
+def pip_version_for(matlab_version):
+    """
+    Map a MATLAB release to its matlabengine version on PyPI.
+    
+    Args:
+        matlab_version (str or None): MATLAB release, e.g. 'R2024b'
+        
+    Returns:
+        str or None: Version prefix such as '24.2', or None for releases
+            before R2022b (no prebuilt wheel) and unrecognised strings
+    """
+    if not matlab_version or not is_matlab_release(matlab_version):
+        return None
+    
+    year, half = int(matlab_version[1:5]), matlab_version[5].lower()
+    if (year, half) < (2022, 'b'):
+        return None
+    if (year, half) == (2022, 'b'):
+        return '9.13'
+    if (year, half) == (2023, 'a'):
+        return '9.14'
+    # From R2023b on, wheels are numbered YY.1 (a) / YY.2 (b)
+    return f"{year % 100}.{1 if half == 'a' else 2}"
+
+
+def install_matlab_engine(matlab_path, python_executable, matlab_version=None):
     """
     Install MATLAB Engine to a specific Python environment.
     
+    For R2022b and later the prebuilt matlabengine wheel is installed with
+    pip; setup.py in the MATLAB tree is used for older releases or when
+    the wheel cannot be fetched (e.g. offline).
+    
     Args:
         matlab_path (Path or str): Path to MATLAB installation directory
         python_executable (Path or str): Path to Python executable
+        matlab_version (str, optional): MATLAB release (e.g. 'R2024b');
+            read from the installation when omitted
         
     Returns:
         dict: Installation result {
             'success': bool,
             'returncode': int,
-            'stdout': str,
-            'stderr': str,
+            'stdout': str,  # Tail of combined stdout/stderr
+            'stderr': str,  # Same tail when installation failed
             'error': str or None
         }
     """
@@ -36,44 +144,55 @@ def install_matlab_engine(matlab_path, python_executable):
         'error': None
     }
     
-    # Verify MATLAB setup.py exists
-    matlab_setup = matlab_path / "extern" / "engines" / "python" / "setup.py"
-    if not matlab_setup.exists():
-        result['error'] = f"MATLAB setup.py not found at: {matlab_setup}"
-        return result
+    if matlab_version is None:
+        matlab_version = get_matlab_version(matlab_path)
+    pip_version = pip_version_for(matlab_version)
     
-    # Verify Python executable exists
-    if not python_executable.exists():
-        result['error'] = f"Python executable not found at: {python_executable}"
+    # Verify MATLAB setup.py exists (the child would only report a missing
+    # script through its exit code). A missing Python executable surfaces
+    # as FileNotFoundError when the process is started.
+    matlab_setup = get_matlab_engine_setup_path(matlab_path)
+    if matlab_setup is None and pip_version is None:
+        result['error'] = f"MATLAB setup.py not found at: {matlab_path / 'extern' / 'engines' / 'python' / 'setup.py'}"
         return result
     
     print(f"\nInstalling MATLAB Engine to: {python_executable}")
     print(f"Using MATLAB at: {matlab_path}")
-    print(f"Setup script: {matlab_setup}")
-    print("This may take a few minutes...")
     
-    # Run setup.py install
     try:
-        proc_result = subprocess.run(
-            [str(python_executable), str(matlab_setup), "install"],
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        if pip_version:
+            print(f"Installing prebuilt matlabengine {pip_version}.* wheel...")
+            returncode, output = run_streamed(
+                [os.fspath(python_executable), "-m", "pip", "install",
+                 *PIP_INSTALL_OPTIONS, f"matlabengine=={pip_version}.*"],
+                timeout=300
+            )
+            if returncode != 0 and matlab_setup is not None:
+                print("[WARN] Wheel install failed, falling back to setup.py")
         
-        result['returncode'] = proc_result.returncode
-        result['stdout'] = proc_result.stdout
-        result['stderr'] = proc_result.stderr
+        if not pip_version or (returncode != 0 and matlab_setup is not None):
+            print(f"Setup script: {matlab_setup}")
+            print("This may take a few minutes...")
+            
+            # Run setup.py install
+            install_cmd = [os.fspath(python_executable), os.fspath(matlab_setup), "install"]
+            # Output is echoed while setup.py runs, so it isn't repeated on failure
+            returncode, output = run_streamed(install_cmd, timeout=300)  # 5 minute timeout
         
-        if proc_result.returncode == 0:
+        result['returncode'] = returncode
+        result['stdout'] = output
+        
+        if returncode == 0:
             result['success'] = True
             print("\n[SUCCESS] MATLAB Engine installed successfully!")
         else:
-            result['error'] = f"Installation failed with return code {proc_result.returncode}"
+            result['stderr'] = output
+            result['error'] = f"Installation failed with return code {returncode}"
             print(f"\n[ERROR] {result['error']}")
-            if proc_result.stderr:
-                print(f"Error details:\n{proc_result.stderr}")
         
+    except FileNotFoundError:
+        result['error'] = f"Python executable not found at: {python_executable}"
+        print(f"\n[ERROR] {result['error']}")
     except subprocess.TimeoutExpired:
         result['error'] = "Installation timed out after 5 minutes"
         print(f"\n[ERROR] {result['error']}")
@@ -84,6 +203,56 @@ def install_matlab_engine(matlab_path, python_executable):
     return result
 
 
+def install_matlab_engine_many(tasks, max_workers=4):
+    """
+    Install MATLAB Engine into several Python environments concurrently.
+    
+    Each install is its own subprocess with its own pipes, so no state is
+    shared between workers. Tasks that use the same MATLAB installation
+    run one after another, since setup.py builds inside the MATLAB tree.
+    Output from concurrent installs is interleaved on the console.
+    
+    Args:
+        tasks (list): (matlab_path, python_executable) pairs
+        max_workers (int): Maximum number of concurrent installs
+        
+    Returns:
+        list[dict]: install_matlab_engine() results, in task order
+    """
+    tasks = list(tasks)
+    groups = {}
+    for index, (matlab_path, python_executable) in enumerate(tasks):
+        key = os.path.normcase(os.fspath(Path(matlab_path)))
+        groups.setdefault(key, []).append((index, matlab_path, python_executable))
+    
+    def run_group(group):
+        return [(index, install_matlab_engine(matlab_path, python_executable))
+                for index, matlab_path, python_executable in group]
+    
+    results = [None] * len(tasks)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for group_results in executor.map(run_group, groups.values()):
+            for index, result in group_results:
+                results[index] = result
+    
+    return results
+
+
+def verify_matlab_engine_installation_many(python_executables, max_workers=4):
+    """
+    Verify MATLAB Engine in several Python environments concurrently.
+    
+    Args:
+        python_executables (list): Paths to Python executables
+        max_workers (int): Maximum number of concurrent checks
+        
+    Returns:
+        list[dict]: verify_matlab_engine_installation() results, in input order
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(verify_matlab_engine_installation, python_executables))
+
+
 def verify_matlab_engine_installation(python_executable):
     """
     Verify that MATLAB Engine is installed in a Python environment.
@@ -108,16 +277,17 @@ def verify_matlab_engine_installation(python_executable):
         'error': None
     }
     
-    if not python_executable.exists():
-        result['error'] = f"Python executable not found: {python_executable}"
-        return result
+    # Checking our own interpreter needs no subprocess
+    if python_executable.resolve() == Path(sys.executable).resolve():
+        return _verify_matlab_engine_in_process(result)
     
     # Try to import matlab.engine
     test_script = "import matlab.engine; print(matlab.engine.__version__ if hasattr(matlab.engine, '__version__') else 'installed')"
     
     try:
+        # Short and quiet: capture_output with a hard timeout is enough here
         proc_result = subprocess.run(
-            [str(python_executable), "-c", test_script],
+            [os.fspath(python_executable), "-c", test_script],
             capture_output=True,
             text=True,
             timeout=30
@@ -126,13 +296,16 @@ def verify_matlab_engine_installation(python_executable):
         if proc_result.returncode == 0:
             result['installed'] = True
             result['import_successful'] = True
-            version_output = proc_result.stdout.strip()
-            result['version'] = version_output if version_output else "unknown"
+            # The version is the last line printed by the test script
+            output_lines = proc_result.stdout.strip().splitlines()
+            result['version'] = output_lines[-1] if output_lines else "unknown"
         else:
             result['error'] = proc_result.stderr.strip()
             if "No module named 'matlab'" in result['error']:
                 result['error'] = "MATLAB Engine not installed"
         
+    except FileNotFoundError:
+        result['error'] = f"Python executable not found: {python_executable}"
     except subprocess.TimeoutExpired:
         result['error'] = "Verification timed out"
     except Exception as e:
@@ -141,6 +314,37 @@ def verify_matlab_engine_installation(python_executable):
     return result
 
 
+def _verify_matlab_engine_in_process(result):
+    """
+    Fill a verification result by importing matlab.engine in this process.
+    
+    Args:
+        result (dict): Verification result to fill
+        
+    Returns:
+        dict: The updated verification result
+    """
+    try:
+        spec = importlib.util.find_spec('matlab.engine')
+    except ImportError:
+        spec = None
+    
+    if spec is None:
+        result['error'] = "MATLAB Engine not installed"
+        return result
+    
+    try:
+        engine = importlib.import_module('matlab.engine')
+    except Exception as e:
+        result['error'] = f"Verification error: {str(e)}"
+        return result
+    
+    result['installed'] = True
+    result['import_successful'] = True
+    result['version'] = getattr(engine, '__version__', 'installed')
+    return result
+
+
 def uninstall_matlab_engine(python_executable):
     """
     Uninstall MATLAB Engine from a Python environment.
@@ -167,15 +371,11 @@ def uninstall_matlab_engine(python_executable):
         'error': None
     }
     
-    if not python_executable.exists():
-        result['error'] = f"Python executable not found: {python_executable}"
-        return result
-    
     print(f"\nUninstalling MATLAB Engine from: {python_executable}")
     
     try:
         proc_result = subprocess.run(
-            [str(python_executable), "-m", "pip", "uninstall", "-y", "matlabengine"],
+            [os.fspath(python_executable), "-m", "pip", "uninstall", "-y", "matlabengine"],
             capture_output=True,
             text=True,
             timeout=60
@@ -191,7 +391,13 @@ def uninstall_matlab_engine(python_executable):
         else:
             result['error'] = f"Uninstallation failed with return code {proc_result.returncode}"
             print(f"[ERROR] {result['error']}")
+            # pip ran quietly; show its error output in one write
+            sys.stderr.write(proc_result.stderr)
+            sys.stderr.flush()
         
+    except FileNotFoundError:
+        result['error'] = f"Python executable not found: {python_executable}"
+        print(f"[ERROR] {result['error']}")
     except subprocess.TimeoutExpired:
         result['error'] = "Uninstallation timed out"
         print(f"[ERROR] {result['error']}")
@@ -214,4 +420,8 @@ def get_matlab_engine_setup_path(matlab_path):
     """
     matlab_path = Path(matlab_path)
     setup_py = matlab_path / "extern" / "engines" / "python" / "setup.py"
-    return setup_py if setup_py.exists() else None
+    try:
+        setup_py.stat()
+    except OSError:
+        return None
+    return setup_py
@@ -9,9 +9,49 @@ This module handles platform-specific configurations including:
 
 import sys
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 
 
+DEFAULT_APP_ID = 'AjoyLab.ZULFNMRSuite.Application.0.1'
+
+_CONFIG_FILE = Path(__file__).resolve().parents[2] / 'config.txt'
+
+# "APP_USER_MODEL_ID = value" on a line of its own
+_APP_ID_RE = re.compile(r'^[ \t]*APP_USER_MODEL_ID[ \t]*=(.*)$', re.MULTILINE)
+
+# shell32 entry point looked up once, with its signature declared
+if sys.platform.startswith('win'):
+    import ctypes
+    
+    _SET_APP_ID = ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID
+    _SET_APP_ID.argtypes = [ctypes.c_wchar_p]
+    _SET_APP_ID.restype = ctypes.HRESULT
+else:
+    _SET_APP_ID = None
+
+
+@lru_cache(maxsize=1)
+def _load_app_id():
+    """
+    Read APP_USER_MODEL_ID from config.txt (cached after the first call).
+    
+    We need this before full Qt initialization, so config.txt is scanned
+    directly instead of going through the Config singleton.
+    
+    Returns:
+        str: Configured App User Model ID, or DEFAULT_APP_ID
+    """
+    try:
+        text = _CONFIG_FILE.read_text(encoding='utf-8')
+    except OSError:
+        return DEFAULT_APP_ID
+    
+    match = _APP_ID_RE.search(text)
+    return match.group(1).strip() if match else DEFAULT_APP_ID
+
+
 def setup_windows_app_id():
     """
     Setup Windows taskbar App User Model ID.
@@ -22,30 +62,15 @@ def setup_windows_app_id():
     Returns:
         bool: True if setup was successful, False otherwise
     """
-    if not sys.platform.startswith('win'):
+    if _SET_APP_ID is None:
         return False
     
     try:
-        import ctypes
-        
-        # Import config to get APP_USER_MODEL_ID
-        # We need to do a minimal import before full Qt initialization
-        config_file = Path(__file__).parent.parent.parent / 'config.txt'
-        app_id = 'AjoyLab.ZULFNMRSuite.Application.0.1'  # Default fallback
-        
-        if config_file.exists():
-            with open(config_file, 'r', encoding='utf-8') as f:
-                for line in f:
-                    line = line.strip()
-                    if line.startswith('APP_USER_MODEL_ID'):
-                        parts = line.split('=', 1)
-                        if len(parts) == 2:
-                            app_id = parts[1].strip()
-                            break
+        app_id = _load_app_id()
         
         # Set App User Model ID for Windows taskbar
         # This works on both win32 and win64
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(app_id)
+        _SET_APP_ID(app_id)
         print(f"Windows App ID set: {app_id}")
         return True
         
@@ -1,27 +1,46 @@
 import os
+import re
 import json
 import csv
+from pathlib import Path
+import numpy as np
 from dataclasses import dataclass, field    
-from typing import List, Dict, Any  
-from PySide6.QtWidgets import QFileDialog, QApplication
+from typing import Dict, Any  
 
 
+# Whole comma/space separated integer tokens, e.g. "1, 2 3"
+_SPIN_INDEX_RE = re.compile(r'(?<![^\s,])\d+(?![^\s,])')
 
-@dataclass
+# QApplication kept alive between folder dialogs (created on first use)
+_dialog_app = None
+
+
+# eq=False: the generated __eq__/__hash__ would compare the ndarray fields,
+# which raises; records compare and hash by identity instead
+@dataclass(slots=True, frozen=True, eq=False)
 class MoleculeData:
     name: str
-    isotopes: List[str]  # e.g. ['1H', '13C', ...]
-    J_coupling: List[List[float]]  # 2D matrix, e.g. [[0, 7.1], [7.1, 0]]
-    symmetry_group: List[str] = None  
-    symmetry_spins: List[List[int]] = None  
-    information: str = None
+    isotopes: tuple[str, ...]  # e.g. ('1H', '13C', ...)
+    J_coupling: np.ndarray  # 2D float64 matrix, e.g. [[0, 7.1], [7.1, 0]]
+    symmetry_group: tuple[str, ...] = ()
+    symmetry_spins: tuple[np.ndarray, ...] = ()  # 1D int arrays of spin indices
+    information: str | None = None
+
+    def __post_init__(self):
+        # frozen only covers the attributes; lock the array contents too
+        self.J_coupling.setflags(write=False)
+        for spins in self.symmetry_spins:
+            spins.setflags(write=False)
 
 def get_user_save_path() -> str:
     """Get user save path using PySide6 file dialog"""
-    # Ensure QApplication exists
-    app = QApplication.instance()
-    if app is None:
-        app = QApplication([])
+    global _dialog_app
+    # Imported here so reading molecules from a given path never loads Qt
+    from PySide6.QtWidgets import QFileDialog, QApplication
+    
+    # Ensure QApplication exists, reusing ours across calls
+    if QApplication.instance() is None:
+        _dialog_app = QApplication([])
     
     user_save_path = QFileDialog.getExistingDirectory(
         None,
@@ -37,42 +56,49 @@ def read_user_molecule(structure_path: str = None, symmetry_path: str = None) ->
     #USER_SAVE_PATH = filedialog.askdirectory(title="please select a folder")
     # Validate structure file
     if structure_path is None:
-        user_save_path = get_user_save_path()
-        folder = os.path.join(user_save_path)
-        structure_path = os.path.join(folder, 'structure.csv')
-        symmetry_path = os.path.join(folder, 'symmetry.csv')
-        name = os.path.basename(folder)
+        folder = Path(get_user_save_path())
+        structure_path = folder / 'structure.csv'
+        symmetry_path = folder / 'symmetry.csv'
+    else:
+        folder = Path(structure_path).parent
+    # "." or a trailing separator leaves .name empty
+    name = folder.name or folder.resolve().name
     if not os.path.exists(structure_path):
         raise FileNotFoundError(f"Structure file not found: {structure_path}")
     with open(structure_path, 'r', encoding='utf-8') as f:
-        reader = csv.reader(f)
-        rows = [row for row in reader]
-    if not rows or len(rows) < 2:
+        # Isotope header via csv, then the numeric matrix straight from the same handle
+        isotopes = next(csv.reader(f), None)
+        try:
+            with warnings.catch_warnings():
+                # An empty matrix is reported below, not as a numpy warning
+                warnings.simplefilter('ignore', UserWarning)
+                J_coupling = np.loadtxt(f, delimiter=',', dtype=np.float64, ndmin=2)
+        except ValueError:
+            raise ValueError("J coupling matrix format error, must be numeric")
+    if not isotopes or J_coupling.size == 0:
         raise ValueError("Structure file is empty or format error (at least one isotope row and one J matrix row required)")
-    isotopes = rows[0]
-    try:
-        J_coupling = [list(map(float, row)) for row in rows[1:]]
-    except Exception:
-        raise ValueError("J coupling matrix format error, must be numeric")
     symmetry_group = []
     symmetry_spins = []
-    if symmetry_path and os.path.exists(symmetry_path):
-        with open(symmetry_path, 'r', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            for row in reader:
-                if len(row) >= 2:
-                    group = row[0].strip()
-                    spins = [int(x) for x in row[1].replace(',', ' ').split() if x.strip().isdigit()]
-                    symmetry_group.append(group)
-                    symmetry_spins.append(spins)
+    try:
+        symmetry_text = Path(symmetry_path).read_text(encoding='utf-8') if symmetry_path else None
+    except FileNotFoundError:
+        symmetry_text = None
+    if symmetry_text is not None:
+        # Tiny file: split "GROUP,SPINS" lines by hand
+        for line in symmetry_text.splitlines():
+            parts = line.split(',', 1)
+            if len(parts) == 2:
+                group = parts[0].strip().strip('"')
+                spins = np.array(_SPIN_INDEX_RE.findall(parts[1].strip().strip('"')), dtype=np.int64)
+                symmetry_group.append(group)
+                symmetry_spins.append(spins)
     else:
         warnings.warn(f"Symmetry file not found: {symmetry_path}")
     # Read information.txt
     information = None
-    folder = os.path.join(user_save_path)
-    info_path = os.path.join(folder, 'information.txt')
+    info_path = folder / 'information.txt'
     if os.path.exists(info_path):
         with open(info_path, 'r', encoding='utf-8') as f:
             information = f.read()
-    return MoleculeData(name=name, isotopes=isotopes, J_coupling=J_coupling, symmetry_group=symmetry_group, symmetry_spins=symmetry_spins, information=information)
+    return MoleculeData(name=name, isotopes=tuple(isotopes), J_coupling=J_coupling, symmetry_group=tuple(symmetry_group), symmetry_spins=tuple(symmetry_spins), information=information)
 
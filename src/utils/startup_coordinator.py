@@ -5,42 +5,110 @@ This module coordinates the application startup flow after splash screen,
 including MATLAB detection, dialog presentation, and main application launch.
 """
 
+import logging
+import os
 import sys
+from functools import lru_cache
 from pathlib import Path
-from PySide6.QtWidgets import QMessageBox, QDialog
 
 
-def detect_matlab_info(init_results):
+class _TagFormatter(logging.Formatter):
+    """Format records as '[INFO] message' to match the console output elsewhere"""
+    
+    TAGS = {logging.DEBUG: 'DEBUG', logging.INFO: 'INFO', logging.WARNING: 'WARN'}
+    
+    def format(self, record):
+        tag = self.TAGS.get(record.levelno, record.levelname)
+        return f"[{tag}] {super().format(record)}"
+
+
+log = logging.getLogger('startup')
+log.setLevel(logging.DEBUG)
+log.propagate = False
+if sys.stdout is not None:
+    # Same stream as print(), so messages stay in order with the output of
+    # the installer and config code; StreamHandler flushes every record
+    _handler = logging.StreamHandler(sys.stdout)
+    _handler.setFormatter(_TagFormatter('%(message)s'))
+    log.addHandler(_handler)
+else:
+    # No console (pythonw)
+    log.addHandler(logging.NullHandler())
+
+
+@lru_cache(maxsize=1)
+def _matlab_dialog_cls():
+    """Import MatlabConfigDialog on first use"""
+    from src.ui.matlab_config_dialog import MatlabConfigDialog
+    return MatlabConfigDialog
+
+
+@lru_cache(maxsize=1)
+def _selection_dialog_cls():
+    """Import StartupSelectionDialog on first use"""
+    from src.ui.startup_selection_dialog import StartupSelectionDialog
+    return StartupSelectionDialog
+
+
+@lru_cache(maxsize=1)
+def _main_app_cls():
+    """Import MainApplication on first use"""
+    from main_application import MainApplication
+    return MainApplication
+
+
+def detect_matlab_info(init_results, get_scan=None):
     """
     Auto-detect MATLAB installation and add info to init_results.
     
+    Reads and updates user_config.json, so call it on the GUI thread.
+    
     Args:
         init_results (dict): Initialization results from splash screen
+        get_scan (callable, optional): Returns {'path': Path or None} from a
+            background scan_matlab_installations(), or None if no scan ran.
+            Only called when neither a configured nor a cached path is
+            available; the disk is scanned here when it gives no result.
         
     Returns:
         dict: Updated init_results with MATLAB detection info
     """
-    from src.utils.first_run_setup import auto_detect_matlab
+    from src.utils.matlab_detector import (
+        _load_cached_matlab, auto_detect_matlab, cache_detected_matlab,
+        get_matlab_version, is_matlab_release
+    )
+    from src.utils.user_config import get_user_config
     
-    detected_matlab = auto_detect_matlab()
+    # A MATLAB the user already configured wins over scanning for one
+    user_config = get_user_config()
+    configured_path = user_config.get_matlab_path()
+    matlab_version = None
+    if configured_path and os.path.isdir(configured_path):
+        detected_matlab = Path(configured_path)
+        saved_version = user_config.get_matlab_version()
+        if saved_version and is_matlab_release(saved_version):
+            matlab_version = saved_version
+    else:
+        detected_matlab = _load_cached_matlab()
+        if detected_matlab is None:
+            scanned = get_scan() if get_scan is not None else None
+            if scanned is not None:
+                detected_matlab = scanned['path']
+                if detected_matlab is not None:
+                    cache_detected_matlab(detected_matlab)
+            else:
+                detected_matlab = auto_detect_matlab(force=True)
     
     if detected_matlab:
-        print(f"[INFO] Detected MATLAB at: {detected_matlab}")
+        log.info(f"Detected MATLAB at: {detected_matlab}")
         init_results['detected_matlab_path'] = str(detected_matlab)
         
         # Try to get version from VersionInfo.xml
-        version_info_file = detected_matlab / "VersionInfo.xml"
-        if version_info_file.exists():
-            try:
-                import xml.etree.ElementTree as ET
-                tree = ET.parse(version_info_file)
-                root = tree.getroot()
-                release = root.find('.//release')
-                if release is not None and release.text:
-                    init_results['detected_matlab_version'] = release.text.strip()
-                    print(f"[INFO] MATLAB Version: {init_results['detected_matlab_version']}")
-            except Exception:
-                pass
+        if matlab_version is None:
+            matlab_version = get_matlab_version(detected_matlab)
+        if matlab_version:
+            init_results['detected_matlab_version'] = matlab_version
+            log.info(f"MATLAB Version: {init_results['detected_matlab_version']}")
     
     return init_results
 
@@ -64,45 +132,44 @@ def create_startup_dialog(init_results, matlab_has_issues=False):
     
     if matlab_has_issues or not matlab_available:
         # MATLAB needs configuration - show config dialog
-        from src.ui.matlab_config_dialog import MatlabConfigDialog
-        
         detected_path = init_results.get('detected_matlab_path')
         matlab_version = init_results.get('detected_matlab_version')
         
-        dialog = MatlabConfigDialog(
+        dialog = _matlab_dialog_cls()(
             detected_matlab_path=detected_path,
             matlab_version=matlab_version
         )
-        print("[INFO] MATLAB has issues - showing configuration dialog")
+        log.info("MATLAB has issues - showing configuration dialog")
         return dialog
     else:
         # MATLAB working - show simple selection dialog
-        from src.ui.startup_selection_dialog import StartupSelectionDialog
-        
-        dialog = StartupSelectionDialog(matlab_available=matlab_available)
-        print("[INFO] Showing startup selection dialog")
+        dialog = _selection_dialog_cls()(matlab_available=matlab_available)
+        log.info("Showing startup selection dialog")
         return dialog
 
 
-def handle_matlab_configuration(startup_config, matlab_available):
+def handle_matlab_configuration(startup_config, matlab_available, use_matlab=None):
     """
     Handle MATLAB configuration if user selected MATLAB mode but it's not ready.
     
     Args:
         startup_config (dict): User's configuration choices
         matlab_available (bool): Whether MATLAB engine is available
+        use_matlab (bool, optional): startup_config['use_matlab'], if the
+            caller has already looked it up
         
     Returns:
         bool: True if restart is needed, False otherwise
     """
-    use_matlab = startup_config.get('use_matlab', False)
+    if use_matlab is None:
+        use_matlab = startup_config.get('use_matlab', False)
     
     if not use_matlab:
         return False
     
     if matlab_available:
         # MATLAB already available, no configuration needed
-        print("[INFO] Using MATLAB engine from initialization")
+        log.info("Using MATLAB engine from initialization")
         return False
     
     # User wants MATLAB but it's not ready
@@ -112,8 +179,8 @@ def handle_matlab_configuration(startup_config, matlab_available):
     
     if configure_matlab:
         # User explicitly clicked "Configure MATLAB" - do configuration now
-        print("[INFO] User chose MATLAB but engine not ready - applying configuration...")
-        from src.utils.first_run_setup import apply_user_config
+        log.info("User chose MATLAB but engine not ready - applying configuration...")
+        from src.utils.config_applier import apply_user_config
         
         config_results = apply_user_config(startup_config)
         
@@ -123,8 +190,8 @@ def handle_matlab_configuration(startup_config, matlab_available):
             return True
     else:
         # User selected MATLAB but didn't configure - inform them to configure later
-        print("[WARN] User selected MATLAB but engine not available and not configured")
-        print("[WARN] Application will start in Pure Python mode")
+        log.warning("User selected MATLAB but engine not available and not configured")
+        log.warning("Application will start in Pure Python mode")
         # Don't force configuration - let them use Pure Python for now
     
     return False
@@ -134,6 +201,8 @@ def show_restart_message():
     """
     Show restart required message after MATLAB Engine installation.
     """
+    from PySide6.QtWidgets import QMessageBox
+    
     msg = QMessageBox()
     msg.setIcon(QMessageBox.Information)
     msg.setWindowTitle("Configuration Complete - Restart Required")
@@ -147,10 +216,8 @@ def show_restart_message():
     msg.setDefaultButton(QMessageBox.Ok)
     msg.exec()
     
-    print("\n" + "="*60)
-    print("CONFIGURATION COMPLETE - PLEASE RESTART APPLICATION")
-    print("="*60)
-    print("\nRun start.bat again to start with MATLAB Spinach engine.")
+    log.info("CONFIGURATION COMPLETE - PLEASE RESTART APPLICATION")
+    log.info("Run start.bat again to start with MATLAB Spinach engine.")
 
 
 def cleanup_matlab_engine(splash_worker):
@@ -164,11 +231,11 @@ def cleanup_matlab_engine(splash_worker):
         return
     
     try:
-        print("[INFO] Cleaning up MATLAB engine...")
+        log.info("Cleaning up MATLAB engine...")
         splash_worker.engine_cm.__exit__(None, None, None)
-        print("[INFO] MATLAB engine cleaned up successfully")
+        log.info("MATLAB engine cleaned up successfully")
     except Exception as e:
-        print(f"[WARN] Failed to cleanup MATLAB engine: {e}")
+        log.warning(f"Failed to cleanup MATLAB engine: {e}")
 
 
 def save_user_configuration(startup_config):
@@ -184,13 +251,14 @@ def save_user_configuration(startup_config):
     execution_mode = startup_config.get('execution_mode', 'local')
     
     user_config = get_user_config()
-    user_config.set_preferences(
-        use_matlab=use_matlab,
-        execution_mode=execution_mode
-    )
-    user_config.mark_first_run_complete()
+    with user_config.batch():
+        user_config.set_preferences(
+            use_matlab=use_matlab,
+            execution_mode=execution_mode
+        )
+        user_config.mark_first_run_complete()
     
-    print(f"[INFO] Configuration saved: use_matlab={use_matlab}, execution_mode={execution_mode}")
+    log.info(f"Configuration saved: use_matlab={use_matlab}, execution_mode={execution_mode}")
 
 
 def start_main_application(startup_config):
@@ -203,15 +271,13 @@ def start_main_application(startup_config):
     Returns:
         MainApplication: Main application window instance
     """
-    from main_application import MainApplication
-    
-    print("[INFO] Starting main application...")
-    main_window = MainApplication(startup_config=startup_config)
+    log.info("Starting main application...")
+    main_window = _main_app_cls()(startup_config=startup_config)
     main_window.show()
     main_window.raise_()
     main_window.activateWindow()
     
-    print("[INFO] Main application started successfully")
+    log.info("Main application started successfully")
     return main_window
 
 
@@ -233,11 +299,13 @@ def handle_splash_completion(splash, app):
     Returns:
         MainApplication or None: Main window if started, None if exited
     """
-    print("\n[DEBUG] handle_splash_completion() called")
-    print(f"[DEBUG] init_success: {splash.init_success}")
+    log.debug("handle_splash_completion() called")
+    log.debug(f"init_success: {splash.init_success}")
     
     if not splash.init_success:
         # Initialization failed - show error and exit
+        from PySide6.QtWidgets import QMessageBox
+        
         QMessageBox.critical(
             None,
             "Initialization Failed",
@@ -249,37 +317,42 @@ def handle_splash_completion(splash, app):
     
     # Get initialization results from splash screen worker
     init_results = splash.worker.get_init_results() if splash.worker else {}
-    print(f"[DEBUG] init_results: {init_results}")
+    log.debug(f"init_results: {init_results}")
     
     # Check MATLAB status
     matlab_available = init_results.get('matlab_available', False)
     matlab_has_issues = init_results.get('matlab_has_issues', False)
     
     if matlab_available:
-        print("[INFO] MATLAB engine started successfully during initialization")
+        log.info("MATLAB engine started successfully during initialization")
     else:
-        print("[INFO] MATLAB engine not available")
+        log.info("MATLAB engine not available")
         if matlab_has_issues:
             matlab_error = init_results.get('matlab_error', 'Unknown error')
-            print(f"[WARN] MATLAB issues detected: {matlab_error}")
+            log.warning(f"MATLAB issues detected: {matlab_error}")
     
-    # Auto-detect MATLAB installation path for display
-    init_results = detect_matlab_info(init_results)
+    # Auto-detect MATLAB installation path for display. If neither a
+    # configured nor a cached path was known, the splash worker scanned the
+    # disk in the background; user_config is only touched here, on the GUI
+    # thread.
+    get_scan = splash.worker.get_matlab_detection if splash.worker else None
+    init_results = detect_matlab_info(init_results, get_scan=get_scan)
     
     # Create startup dialog
     startup_dialog = create_startup_dialog(init_results, matlab_has_issues)
     
-    print(f"[DEBUG] StartupDialog created (type: {type(startup_dialog).__name__})")
-    print(f"[DEBUG] Dialog ID: {id(startup_dialog)}")
+    log.debug(f"StartupDialog created (type: {type(startup_dialog).__name__})")
+    log.debug(f"Dialog ID: {id(startup_dialog)}")
     
     # CRITICAL FIX: Connect dialog signal to handle user selection
     # This allows non-modal dialog to work properly
     def on_config_selected(startup_config):
         """Handle user's configuration selection"""
-        print(f"[DEBUG] User selected config: {startup_config}")
+        log.debug(f"User selected config: {startup_config}")
+        use_matlab = startup_config.get('use_matlab', False)
         
         # Handle MATLAB configuration if needed
-        needs_restart = handle_matlab_configuration(startup_config, matlab_available)
+        needs_restart = handle_matlab_configuration(startup_config, matlab_available, use_matlab)
         
         if needs_restart:
             # Exit for restart
@@ -287,7 +360,6 @@ def handle_splash_completion(splash, app):
             return
         
         # Handle Pure Python mode - cleanup MATLAB engine if needed
-        use_matlab = startup_config.get('use_matlab', False)
         if not use_matlab and matlab_available:
             cleanup_matlab_engine(splash.worker)
         
@@ -302,7 +374,7 @@ def handle_splash_completion(splash, app):
     
     def on_dialog_rejected():
         """Handle user cancellation"""
-        print("[INFO] User cancelled startup configuration")
+        log.info("User cancelled startup configuration")
         app.quit()
     
     # Connect signals
@@ -314,7 +386,7 @@ def handle_splash_completion(splash, app):
     startup_dialog.raise_()
     startup_dialog.activateWindow()
     
-    print(f"[DEBUG] Dialog shown (non-modal, signals connected)")
+    log.debug("Dialog shown (non-modal, signals connected)")
     
     # Don't call app.quit() - let the dialog stay open
     # The dialog will handle launching main window via signals
@@ -8,30 +8,75 @@ Handles saving and loading user-specific configuration including:
 - User preferences
 """
 
+import atexit
 import json
+import os
+import sys
+from contextlib import contextmanager
+from functools import cache, cached_property
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson  # Optional C parser; the stdlib json module is the fallback
+except ImportError:
+    orjson = None
+
+_WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def _intern_keys(section):
+    """
+    Rebuild a parsed section with interned keys, recursing into sub-dicts.
+    
+    The getters index with string literals, which CPython interns; keys
+    decoded from JSON are fresh strings. Interning them lets each lookup
+    match on identity instead of comparing characters.
+    """
+    return {
+        sys.intern(key): _intern_keys(value) if isinstance(value, dict) else value
+        for key, value in section.items()
+    }
+
 
 class UserConfig:
     """User configuration manager"""
     
+    # export_summary() labels, indexed by bool / keyed by stored value
+    _YES_NO = ('No', 'Yes')
+    _FIRST_RUN = ('Not completed', 'Completed')
+    _ENGINE = ('Not installed', 'Installed')
+    _USE_MATLAB = ('No (Pure Python)', 'Yes')
+    _EXECUTION_MODES = {'local': 'Local', 'workstation': 'Workstation'}
+    
     def __init__(self):
         """Initialize configuration manager"""
-        self.workspace_root = Path(__file__).parent.parent.parent
+        self.workspace_root = _WORKSPACE_ROOT
         self.config_file = self.workspace_root / "user_config.json"
-        self.config = self._load_config()
+        self._dirty = False
+        self._suspend_save = 0
+        self._batch_now = None
+        # A change whose save failed gets one more try at exit
+        atexit.register(self._save_if_dirty)
+    
+    @cached_property
+    def config(self):
+        """Configuration dict, read from disk on first access"""
+        return self._load_config()
     
     def _load_config(self):
         """Load configuration from file"""
-        if self.config_file.exists():
-            try:
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Warning: Failed to load user config: {e}")
-                return self._default_config()
-        else:
+        # Open directly rather than exists() first: one syscall, no race
+        try:
+            with open(self.config_file, 'rb') as f:
+                data = f.read()
+            config = orjson.loads(data) if orjson is not None else json.loads(data)
+            return _intern_keys(config) if isinstance(config, dict) else config
+        except FileNotFoundError:
+            return self._default_config()
+        except (OSError, ValueError) as e:
+            # ValueError covers both json and orjson decode errors
+            print(f"Warning: Failed to load user config: {e}")
             return self._default_config()
     
     def _default_config(self):
@@ -42,7 +87,11 @@ class UserConfig:
                 'configured': False,
                 'installation_path': None,
                 'version': None,
-                'engine_installed': False
+                'engine_installed': False,
+                'detection_cache': None,
+                'matlab_engine_verified_at': None,
+                'python_exe_mtime': None,
+                'sim_create_seconds': None
             },
             'spinach': {
                 'configured': False,
@@ -60,16 +109,74 @@ class UserConfig:
             }
         }
     
+    @contextmanager
+    def batch(self):
+        """
+        Group several setters into a single save()
+        
+        Example:
+            with user_config.batch():
+                user_config.set_matlab_config(...)
+                user_config.set_preferences(...)
+        """
+        if not self._suspend_save:
+            self._batch_now = datetime.now().isoformat()
+        self._suspend_save += 1
+        try:
+            yield self
+        finally:
+            self._suspend_save -= 1
+            if not self._suspend_save:
+                self._batch_now = None
+                self._save_if_dirty()
+    
+    def _now_iso(self):
+        """Timestamp for setters; one value is shared across a batch()"""
+        return self._batch_now or datetime.now().isoformat()
+    
+    def _changed(self):
+        """Record a modification; save now unless inside batch()"""
+        self._dirty = True
+        if not self._suspend_save:
+            self.save()
+    
+    def _save_if_dirty(self):
+        """Save only if there are unsaved modifications"""
+        if self._dirty:
+            self.save()
+    
     def save(self):
         """Save configuration to file"""
+        # Write a sibling temp file and swap it in, so a crash mid-write
+        # never leaves a truncated user_config.json behind
+        tmp_file = self.config_file.with_name(self.config_file.name + '.tmp')
         try:
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(self.config, f, indent=2)
+            # Compact on disk; export_pretty() gives the readable form
+            if orjson is not None:
+                data = orjson.dumps(self.config)
+            else:
+                data = json.dumps(self.config, separators=(',', ':')).encode('utf-8')
+            tmp_file.write_bytes(data)
+            os.replace(tmp_file, self.config_file)
+            self._dirty = False
             return True
         except Exception as e:
             print(f"Error: Failed to save user config: {e}")
+            try:
+                tmp_file.unlink()
+            except OSError:
+                pass
             return False
     
+    def export_pretty(self):
+        """
+        Get the configuration as indented JSON for display or bug reports
+        
+        Returns:
+            str: Configuration formatted with two-space indentation
+        """
+        return json.dumps(self.config, indent=2)
+    
     def is_first_run(self):
         """Check if this is the first run"""
         return not self.config.get('first_run_completed', False)
@@ -78,8 +185,8 @@ class UserConfig:
         """Mark first run as completed"""
         self.config['first_run_completed'] = True
         if not self.config['history']['first_run_date']:
-            self.config['history']['first_run_date'] = datetime.now().isoformat()
-        self.save()
+            self.config['history']['first_run_date'] = self._now_iso()
+        self._changed()
     
     def set_matlab_config(self, matlab_path, version=None, engine_installed=False):
         """
@@ -94,8 +201,74 @@ class UserConfig:
         self.config['matlab']['installation_path'] = str(matlab_path) if matlab_path else None
         self.config['matlab']['version'] = version
         self.config['matlab']['engine_installed'] = engine_installed
-        self.config['history']['last_matlab_config_date'] = datetime.now().isoformat()
-        self.save()
+        self.config['history']['last_matlab_config_date'] = self._now_iso()
+        self._changed()
+    
+    def get_matlab_cache(self):
+        """
+        Get cached MATLAB auto-detection result
+        
+        Returns:
+            dict or None: {'path': str, 'mtime': float, 'detected_at': str}
+        """
+        return self.config['matlab'].get('detection_cache')
+    
+    def set_matlab_cache(self, matlab_path, mtime):
+        """
+        Save MATLAB auto-detection result
+        
+        Args:
+            matlab_path: Detected MATLAB installation directory
+            mtime: Modification time of bin/matlab.exe at detection
+        """
+        self.config['matlab']['detection_cache'] = {
+            'path': str(matlab_path),
+            'mtime': mtime,
+            'detected_at': self._now_iso()
+        }
+        self._changed()
+    
+    def get_engine_verification(self):
+        """
+        Get the last successful MATLAB Engine import check
+        
+        Returns:
+            dict: {'verified_at': str or None, 'python_exe_mtime': float or None}
+        """
+        return {
+            'verified_at': self.config['matlab'].get('matlab_engine_verified_at'),
+            'python_exe_mtime': self.config['matlab'].get('python_exe_mtime')
+        }
+    
+    def set_engine_verification(self, python_exe_mtime):
+        """
+        Record a successful MATLAB Engine import check
+        
+        Args:
+            python_exe_mtime: Modification time of the checked python.exe
+        """
+        self.config['matlab']['matlab_engine_verified_at'] = self._now_iso()
+        self.config['matlab']['python_exe_mtime'] = python_exe_mtime
+        self._changed()
+    
+    def get_sim_create_seconds(self):
+        """
+        Get the last measured splash-screen sim.create() duration
+        
+        Returns:
+            float or None: Seconds, or None if never measured
+        """
+        return self.config['matlab'].get('sim_create_seconds')
+    
+    def set_sim_create_seconds(self, seconds):
+        """
+        Record the splash-screen sim.create() duration
+        
+        Args:
+            seconds: Measured duration in seconds
+        """
+        self.config['matlab']['sim_create_seconds'] = round(seconds, 2)
+        self._changed()
     
     def set_spinach_config(self, spinach_path=None, version=None):
         """
@@ -108,8 +281,8 @@ class UserConfig:
         self.config['spinach']['configured'] = True
         self.config['spinach']['path'] = str(spinach_path) if spinach_path else None
         self.config['spinach']['version'] = version
-        self.config['history']['last_spinach_config_date'] = datetime.now().isoformat()
-        self.save()
+        self.config['history']['last_spinach_config_date'] = self._now_iso()
+        self._changed()
     
     def set_preferences(self, use_matlab=None, execution_mode=None):
         """
@@ -123,7 +296,7 @@ class UserConfig:
             self.config['preferences']['use_matlab'] = use_matlab
         if execution_mode is not None:
             self.config['preferences']['execution_mode'] = execution_mode
-        self.save()
+        self._changed()
     
     def get_matlab_path(self):
         """Get saved MATLAB installation path"""
@@ -151,24 +324,23 @@ class UserConfig:
     
     def export_summary(self):
         """Export configuration summary for display"""
+        config = self.config
+        matlab = config['matlab']
+        preferences = config['preferences']
+        execution_mode = preferences['execution_mode']
         return {
-            'First Run': 'Completed' if self.config['first_run_completed'] else 'Not completed',
-            'MATLAB Configured': 'Yes' if self.is_matlab_configured() else 'No',
-            'MATLAB Path': self.get_matlab_path() or 'Not set',
-            'MATLAB Version': self.get_matlab_version() or 'Unknown',
-            'MATLAB Engine': 'Installed' if self.is_matlab_engine_installed() else 'Not installed',
-            'Spinach Configured': 'Yes' if self.is_spinach_configured() else 'No',
-            'Use MATLAB': 'Yes' if self.config['preferences']['use_matlab'] else 'No (Pure Python)',
-            'Execution Mode': self.config['preferences']['execution_mode'].title()
+            'First Run': self._FIRST_RUN[bool(config['first_run_completed'])],
+            'MATLAB Configured': self._YES_NO[bool(matlab.get('configured', False))],
+            'MATLAB Path': matlab.get('installation_path') or 'Not set',
+            'MATLAB Version': matlab.get('version') or 'Unknown',
+            'MATLAB Engine': self._ENGINE[bool(matlab.get('engine_installed', False))],
+            'Spinach Configured': self._YES_NO[bool(config['spinach'].get('configured', False))],
+            'Use MATLAB': self._USE_MATLAB[bool(preferences['use_matlab'])],
+            'Execution Mode': self._EXECUTION_MODES.get(execution_mode) or execution_mode.title()
         }
 
 
-# Global instance
-_user_config = None
-
+@cache
 def get_user_config():
-    """Get global user configuration instance"""
-    global _user_config
-    if _user_config is None:
-        _user_config = UserConfig()
-    return _user_config
+    """Get global user configuration instance (created on first call)"""
+    return UserConfig()
@@ -1,5 +1,9 @@
+import codecs
+import mmap
 import os
-import re
+import numpy as np
+
+CHUNK_SIZE = 64 * 1024
 
 files = [
     'CHANGELOG.md',
@@ -9,15 +13,34 @@ files = [
     'dev_log.txt'
 ]
 
+
+def count_chinese(text):
+    """Count CJK unified ideographs (U+4E00..U+9FA5) in text"""
+    # One code point per uint32, compared in bulk instead of matched one by one
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32)
+    return int(np.count_nonzero((codes >= 0x4E00) & (codes <= 0x9FA5)))
+
+
+def count_chinese_file(path):
+    """Count Chinese characters in a UTF-8 file, one mapped chunk at a time"""
+    with open(path, 'rb') as fh:
+        if os.fstat(fh.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Incremental decoder carries multi-byte sequences split across chunks
+            decoder = codecs.getincrementaldecoder('utf-8')()
+            total = 0
+            for start in range(0, len(mm), CHUNK_SIZE):
+                total += count_chinese(decoder.decode(mm[start:start + CHUNK_SIZE]))
+            return total + count_chinese(decoder.decode(b'', final=True))
+
+
 print("Checking Chinese characters in root files:")
 print("=" * 60)
 
 for f in files:
     if os.path.exists(f):
-        with open(f, 'r', encoding='utf-8') as file:
-            content = file.read()
-        chinese = re.findall(r'[\u4e00-\u9fa5]', content)
-        print(f"{f:40} {len(chinese):4} Chinese characters")
+        print(f"{f:40} {count_chinese_file(f):4} Chinese characters")
     else:
         print(f"{f:40} NOT FOUND")
 
@@ -0,0 +1,25 @@
+"""
+Shared pytest fixtures for the test scripts.
+
+The scripts also run standalone (python tests/test_name.py); there they
+create their own QApplication the same way as the fixture below.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path once; the scripts below repeat this guarded
+# insert so they still import src when run standalone
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    """One QApplication for the whole session (Qt plugins/fonts load once)"""
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
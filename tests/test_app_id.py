@@ -7,7 +7,23 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# KEY -> value from config.txt, filled on first use
+_CFG_CACHE = {}
+
+
+def _read_config(config_file):
+    """Parse config.txt into _CFG_CACHE once (KEY = VALUE lines, # comments)"""
+    if not _CFG_CACHE:
+        for line in config_file.read_text(encoding='utf-8').splitlines():
+            key, sep, value = line.partition('=')
+            key = key.strip()
+            if sep and key and not key.startswith('#'):
+                _CFG_CACHE.setdefault(key, value.strip())
+    return _CFG_CACHE
+
 
 def test_app_id_reading():
     """Test reading APP_USER_MODEL_ID from config"""
@@ -18,14 +34,7 @@ def test_app_id_reading():
     print(f"File exists: {config_file.exists()}")
     
     if config_file.exists():
-        with open(config_file, 'r', encoding='utf-8') as f:
-            for line in f:
-                line = line.strip()
-                if line.startswith('APP_USER_MODEL_ID'):
-                    parts = line.split('=', 1)
-                    if len(parts) == 2:
-                        app_id = parts[1].strip()
-                        break
+        app_id = _read_config(config_file).get('APP_USER_MODEL_ID')
     
     print(f"\nApp User Model ID: {app_id}")
     
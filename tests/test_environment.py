@@ -49,8 +49,9 @@ def test_environment():
     # Test 3: Check installed packages
     print("[Test 3] Checking installed packages...")
     test_packages = ['PySide6', 'numpy', 'matplotlib']
+    installed_map = env.are_packages_installed(test_packages)
     for pkg in test_packages:
-        installed = env.is_package_installed(pkg)
+        installed = installed_map[pkg]
         status = "✓ installed" if installed else "✗ not installed"
         print(f"  {pkg}: {status}")
     print()
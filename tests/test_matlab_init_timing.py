@@ -1,44 +1,95 @@
 """
 Test script to measure MATLAB initialization timing
-Captures terminal output and timestamps for each step
+Captures timestamps for each step
 """
 
 import sys
 import os
 import time
-import io
-from contextlib import redirect_stdout, redirect_stderr
+from collections import namedtuple
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Name of a shared MATLAB session to attach to, started once from MATLAB with
+#   matlab.engine.shareEngine('zulf_shared')
+# When no such session is running the test cold-starts its own engine.
+SHARED_SESSION = os.environ.get('ZULF_MATLAB_SESSION', 'zulf_shared')
+
+# MATLAB variables this test creates; the only ones cleared in a shared session
+TEST_VARIABLES = "sys inter bas spin_system J_tmp"
+
+TIMING_FILE = 'matlab_init_timing.txt'
+
+class Event(namedtuple('Event', 'elapsed_ns type message')):
+    """One timed step; elapsed_ns is measured from TimingCapture.start()"""
+    __slots__ = ()
+    
+    @property
+    def elapsed(self):
+        """Elapsed time in seconds"""
+        return self.elapsed_ns / 1e9
 
-# Add project to path
-parent_dir = os.path.dirname(os.path.abspath(__file__))
-if parent_dir not in sys.path:
-    sys.path.insert(0, parent_dir)
 
 class TimingCapture:
-    """Capture output and timing information"""
-    def __init__(self):
+    """Capture timing information
+    
+    Args:
+        log_path: Optional file that each event is appended to as it is
+            logged, so the timings survive a crash of the MATLAB engine
+    """
+    def __init__(self, log_path=None):
         self.events = []
-        self.start_time = None
-        self.stdout_buffer = io.StringIO()
-        self.stderr_buffer = io.StringIO()
+        self._t0 = None
+        self.log_path = log_path
+        self._fh = None
+        # Event lines held back so console I/O doesn't land in the timings
+        self._pending = []
     
     def start(self):
         """Start timing"""
-        self.start_time = time.time()
+        if self.log_path:
+            # Line-buffered: each event reaches the file as it is logged
+            self._fh = open(self.log_path, 'w', buffering=1, encoding='utf-8')
+            self._fh.write("MATLAB Initialization Timing Data\n")
+            self._fh.write("="*80 + "\n\n")
+        self._t0 = time.perf_counter_ns()
         self.log_event("START", "Initialization started")
     
     def log_event(self, event_type, message):
         """Log an event with timestamp"""
-        if self.start_time is None:
-            self.start_time = time.time()
-        
-        elapsed = time.time() - self.start_time
-        self.events.append({
-            'elapsed': elapsed,
-            'type': event_type,
-            'message': message
-        })
-        print(f"[{elapsed:6.2f}s] {event_type}: {message}")
+        # Monotonic clock: immune to wall-clock adjustments mid-run
+        now = time.perf_counter_ns()
+        if self._t0 is None:
+            self._t0 = now
+        
+        event = Event(now - self._t0, event_type, message)
+        self.events.append(event)
+        self._pending.append(f"[{event.elapsed:6.2f}s] {event_type}: {message}\n")
+        if self._fh is not None:
+            self._fh.write(f"{event.elapsed:6.2f}s - {event_type}: {message}\n")
+    
+    def write(self, text):
+        """Queue raw text (e.g. a traceback) behind the pending event lines"""
+        self._pending.append(text)
+    
+    def flush(self):
+        """Write the event lines logged so far in one go"""
+        sys.stdout.write("".join(self._pending))
+        sys.stdout.flush()
+        self._pending.clear()
+    
+    def close(self):
+        """Sync and close the event log file, if one is open"""
+        if self._fh is None:
+            return
+        self._fh.flush()
+        os.fsync(self._fh.fileno())
+        self._fh.close()
+        self._fh = None
     
     def get_percentage(self, elapsed):
         """Estimate percentage based on elapsed time"""
@@ -47,98 +98,92 @@ class TimingCapture:
     
     def print_summary(self):
         """Print timing summary"""
-        print("\n" + "="*80)
-        print("TIMING SUMMARY")
-        print("="*80)
+        self.flush()
+        total_time = self.events[-1].elapsed if self.events else 0
+        inv_total = 1.0 / total_time if total_time > 0 else 0.0
         
-        total_time = self.events[-1]['elapsed'] if self.events else 0
+        lines = ["", "="*80, "TIMING SUMMARY", "="*80]
         
+        fmt = "{:6.2f}s ({:5.1f}%) - {}: {}".format
         for event in self.events:
-            elapsed = event['elapsed']
-            percent = (elapsed / total_time * 100) if total_time > 0 else 0
-            print(f"{elapsed:6.2f}s ({percent:5.1f}%) - {event['type']}: {event['message']}")
+            elapsed = event.elapsed
+            lines.append(fmt(elapsed, elapsed * inv_total * 100, event.type, event.message))
         
-        print(f"\nTotal time: {total_time:.2f}s")
-        print("="*80)
+        lines += ["", f"Total time: {total_time:.2f}s", "="*80]
         
         # Suggest progress bar breakpoints
-        print("\nSUGGESTED PROGRESS BAR BREAKPOINTS (30-90%):")
-        print("-"*80)
+        lines += ["", "SUGGESTED PROGRESS BAR BREAKPOINTS (30-90%):", "-"*80]
         
         # Map to 30-90% range (60% total)
+        fmt = "{:5.1f}% - {}".format
         for event in self.events[1:]:  # Skip START event
-            elapsed = event['elapsed']
-            # Map to 30-90% range
-            progress_percent = 30 + (elapsed / total_time * 60)
-            print(f"{progress_percent:5.1f}% - {event['message']}")
+            lines.append(fmt(30 + event.elapsed * inv_total * 60, event.message))
         
-        print("-"*80)
+        lines.append("-"*80)
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
-def run_matlab_initialization():
-    """Run MATLAB initialization and capture timing"""
+def run_matlab_initialization(log_path=None):
+    """Run MATLAB initialization and capture timing
+    
+    Args:
+        log_path: Optional file the events are streamed to while running
+    
+    Returns:
+        list: The captured Event tuples
+    """
     
-    timer = TimingCapture()
+    timer = TimingCapture(log_path=log_path)
     timer.start()
+    engine_ready = False
     
     try:
         # Step 1: Import modules
         timer.log_event("IMPORT", "Importing spinach_bridge modules")
         from src.core.spinach_bridge import (
-            spinach_eng, call_spinach, 
-            sys as SYS, bas as BAS, inter as INTER, sim as SIM
+            spinach_eng, call_spinach, sim as SIM
         )
         
-        # Step 2: Start MATLAB engine
-        timer.log_event("ENGINE_START", "Starting MATLAB engine")
-        engine_cm = spinach_eng(clean=True)
+        # Step 2: Attach to the shared MATLAB session, or start an engine
+        import matlab.engine
+        attached = SHARED_SESSION in matlab.engine.find_matlab()
+        if attached:
+            timer.log_event("ENGINE_ATTACH", f"Attaching to shared MATLAB session '{SHARED_SESSION}'")
+        else:
+            timer.log_event("ENGINE_START", "Starting MATLAB engine")
+        engine_cm = spinach_eng(clean=True, attach_name=SHARED_SESSION)
         eng = engine_cm.__enter__()
         call_spinach.default_eng = eng
+        if attached:
+            # clean=True leaves a shared session alone; drop only our leftovers
+            eng.eval(f"clear {TEST_VARIABLES}", nargout=0)
         timer.log_event("ENGINE_READY", "MATLAB engine ready")
+        engine_ready = True
         
-        # Step 3: Create system objects
-        timer.log_event("SYS_CREATE", "Creating system object")
-        sys_obj = SYS()
+        # Step 3: Configure sys/bas/inter and build the spin system.
+        # One batched eval instead of a round-trip per setter.
+        # batch_init converts J itself, so a plain nested list will do.
+        J_matrix = [[0.0, 7.0],
+                    [7.0, 0.0]]
         
-        timer.log_event("SYS_ISOTOPES", "Setting isotopes ['1H', '1H']")
-        sys_obj.isotopes(['1H', '1H'])
-        
-        timer.log_event("SYS_MAGNET", "Setting magnet field 14.1T")
-        sys_obj.magnet(14.1)
-        
-        # Step 4: Create basis objects
-        timer.log_event("BAS_CREATE", "Creating basis object")
-        bas_obj = BAS()
-        
-        timer.log_event("BAS_FORMALISM", "Setting formalism 'sphten-liouv'")
-        bas_obj.formalism('sphten-liouv')
-        
-        timer.log_event("BAS_APPROX", "Setting approximation 'none'")
-        bas_obj.approximation('none')
-        
-        # Step 5: Create interactions
-        timer.log_event("INTER_CREATE", "Creating interactions object")
-        inter_obj = INTER()
-        
-        timer.log_event("INTER_ZEEMAN", "Setting Zeeman interactions")
-        inter_obj.zeeman([0.0, 0.0])
-        
-        timer.log_event("INTER_COUPLING", "Setting J-coupling matrix")
-        import numpy as np
-        J_matrix = np.array([[0.0, 7.0],
-                             [7.0, 0.0]])
-        inter_obj.coupling_array(J_matrix)
-        
-        # Step 6: Create spin system (most time-consuming)
         timer.log_event("SIM_CREATE_START", "Creating SIM object")
         sim_obj = SIM()
         
-        timer.log_event("SIM_CREATE_CALL", "Calling sim.create() [this will take time]")
-        sim_obj.create()  # This calls create(sys, inter) and basis(spin_system, bas)
-        timer.log_event("SIM_CREATE_DONE", "sim.create() completed")
+        timer.log_event("SIM_CREATE_CALL", "Calling sim.batch_init() [this will take time]")
+        sim_obj.batch_init(
+            isotopes=['1H', '1H'],
+            magnet=14.1,
+            formalism='sphten-liouv',
+            approximation='none',
+            zeeman=[0.0, 0.0],
+            J=J_matrix
+        )
+        timer.log_event("SIM_CREATE_DONE", "sim.batch_init() completed")
         
         # Cleanup
         timer.log_event("CLEANUP", "Cleaning up")
+        if attached:
+            eng.eval(f"clear {TEST_VARIABLES}", nargout=0)
         engine_cm.__exit__(None, None, None)
         timer.log_event("END", "Initialization completed successfully")
         
@@ -150,9 +195,16 @@ def run_matlab_initialization():
     except Exception as e:
         timer.log_event("ERROR", f"Error occurred: {str(e)}")
         import traceback
-        traceback.print_exc()
-        timer.print_summary()
+        timer.write(traceback.format_exc())
+        if engine_ready:
+            timer.print_summary()
+        else:
+            # Import or engine start failed: no step timings worth summarising
+            timer.flush()
         return timer.events
+    
+    finally:
+        timer.close()
 
 
 if __name__ == "__main__":
@@ -162,22 +214,16 @@ if __name__ == "__main__":
     print("\nThis will run a complete MATLAB initialization and measure timing.")
     print("Please wait...\n")
     
-    events = run_matlab_initialization()
+    events = run_matlab_initialization(log_path=TIMING_FILE)
     
     print("\n" + "="*80)
     print("TEST COMPLETED")
     print("="*80)
     
-    # Export timing data
-    print("\nExporting timing data to 'matlab_init_timing.txt'...")
-    with open('matlab_init_timing.txt', 'w', encoding='utf-8') as f:
-        f.write("MATLAB Initialization Timing Data\n")
-        f.write("="*80 + "\n\n")
-        
-        for event in events:
-            f.write(f"{event['elapsed']:6.2f}s - {event['type']}: {event['message']}\n")
-        
-        total_time = events[-1]['elapsed'] if events else 0
+    # The events were streamed to the file during the run; append the footer
+    print(f"\nExporting timing data to '{TIMING_FILE}'...")
+    with open(TIMING_FILE, 'a', encoding='utf-8') as f:
+        total_time = events[-1].elapsed if events else 0
         f.write(f"\nTotal time: {total_time:.2f}s\n")
         
         # Progress mapping for 30-90% range
@@ -186,9 +232,9 @@ if __name__ == "__main__":
         f.write("="*80 + "\n")
         
         for event in events[1:]:
-            elapsed = event['elapsed']
+            elapsed = event.elapsed
             progress = 30 + (elapsed / total_time * 60)
-            f.write(f"{progress:5.1f}% at {elapsed:6.2f}s - {event['message']}\n")
+            f.write(f"{progress:5.1f}% at {elapsed:6.2f}s - {event.message}\n")
     
-    print("[OK] Timing data saved to 'matlab_init_timing.txt'")
+    print(f"[OK] Timing data saved to '{TIMING_FILE}'")
     print("\nYou can now use this data to design accurate progress bar updates.")
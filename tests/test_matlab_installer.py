@@ -0,0 +1,39 @@
+"""
+Test MATLAB installer subprocess helpers
+
+Runs without MATLAB: run_streamed is exercised with small Python children.
+"""
+
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+import pytest
+
+from src.utils.matlab_installer import run_streamed
+
+
+def test_run_streamed_output():
+    returncode, output = run_streamed(
+        [sys.executable, "-c", "print('one'); print('two')"], timeout=30
+    )
+    assert returncode == 0
+    assert output.splitlines() == ['one', 'two']
+
+
+def test_run_streamed_kills_silent_child():
+    # The child never prints, so only the timer can enforce the deadline
+    start = time.monotonic()
+    with pytest.raises(subprocess.TimeoutExpired):
+        run_streamed([sys.executable, "-c", "import time; time.sleep(10)"], timeout=1)
+    assert time.monotonic() - start < 5
+
+
+if __name__ == "__main__":
+    sys.exit(pytest.main([__file__, "-q"]))
@@ -7,15 +7,19 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
+from PySide6.QtCore import QTimer
 from PySide6.QtWidgets import QApplication
 from src.ui.startup_dialog import StartupDialog
 
-def test_startup():
-    print("Creating QApplication...")
-    app = QApplication(sys.argv)
+def run_startup(auto_accept=False):
+    """Show the startup dialog; return (result, selected config)
     
+    With auto_accept the dialog presses "Start Application" itself as soon
+    as its event loop runs, so no user interaction is needed.
+    """
     print("Creating StartupDialog...")
     init_results = {
         'matlab_available': True,
@@ -27,6 +31,8 @@ def test_startup():
     dialog = StartupDialog(init_results)
     
     print("Showing dialog...")
+    if auto_accept:
+        QTimer.singleShot(0, dialog.accept_config)
     result = dialog.exec()
     
     if result:
@@ -38,7 +44,17 @@ def test_startup():
     else:
         print("\nCancelled!")
     
-    sys.exit(0)
+    return result, dialog.get_config()
+
+def test_startup(qapp):
+    result, config = run_startup(auto_accept=True)
+    assert result
+    assert config['use_matlab']
+    assert config['execution'] == 'local'
+    assert not config['ui_only_mode']
 
 if __name__ == "__main__":
-    test_startup()
+    print("Creating QApplication...")
+    app = QApplication.instance() or QApplication(sys.argv)
+    run_startup()
+    sys.exit(0)
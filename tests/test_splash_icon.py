@@ -1,53 +1,100 @@
 """
 Test script to verify splash screen taskbar icon display
+
+Shows the splash screen for a fixed time and then quits, so the test
+runs unattended. It uses the offscreen Qt platform unless QT_QPA_PLATFORM
+is set, e.g. QT_QPA_PLATFORM=windows to check the taskbar by eye.
 """
 
+import os
 import sys
 from pathlib import Path
 
+# Must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
 # Add project root to path
-project_root = Path(__file__).parent
-sys.path.insert(0, str(project_root))
+project_root = Path(__file__).parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from PySide6.QtWidgets import QApplication
-from PySide6.QtCore import Qt
-
-# Set App User Model ID for Windows (before creating QApplication)
-if sys.platform.startswith('win'):
-    try:
-        import ctypes
-        ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
-            'AjoyLab.ZULFNMRSuite.Application.3.0'
-        )
-    except Exception as e:
-        print(f"Could not set App ID: {e}")
-
-app = QApplication(sys.argv)
-
-# Set application icon
-from src.utils.icon_manager import icon_manager
-app_icon = icon_manager.get_app_icon()
-if not app_icon.isNull():
-    app.setWindowIcon(app_icon)
-    print("Application icon set")
-else:
-    print("WARNING: Application icon is null!")
-
-# Create and show splash screen
-from src.ui.splash_screen import SplashScreen
-splash = SplashScreen()
-
-print(f"Window flags: {splash.windowFlags()}")
-print(f"Window icon null: {splash.windowIcon().isNull()}")
-print(f"Window title: {splash.windowTitle()}")
-
-splash.setWindowTitle("ZULF-NMR Suite - Loading")  # Set title for taskbar
-splash.show()
-splash.raise_()
-splash.activateWindow()
-
-print("\nSplash screen should now be visible with icon in taskbar")
-print("Check Windows taskbar for the application icon")
-print("Press Ctrl+C to exit")
-
-sys.exit(app.exec())
+from PySide6.QtCore import QTimer
+
+SHOW_MS = 2000  # let the splash paint for ~2s
+
+
+def set_app_user_model_id():
+    """Set App User Model ID for Windows (before creating QApplication)"""
+    if sys.platform.startswith('win'):
+        try:
+            import ctypes
+            ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID(
+                'AjoyLab.ZULFNMRSuite.Application.3.0'
+            )
+        except Exception as e:
+            print(f"Could not set App ID: {e}")
+
+
+def show_splash_with_icon(app):
+    """
+    Set the application icon, show the splash screen for SHOW_MS and quit.
+
+    Returns:
+        dict: {'visible': bool, 'has_icon': bool} sampled just before quitting
+    """
+    # Set application icon
+    from src.utils.icon_manager import icon_manager
+    app_icon = icon_manager.get_app_icon()
+    if not app_icon.isNull():
+        app.setWindowIcon(app_icon)
+        print("Application icon set")
+    else:
+        print("WARNING: Application icon is null!")
+
+    # Create and show splash screen
+    from src.ui.splash_screen import SplashScreen
+    splash = SplashScreen()
+
+    print(f"Window flags: {splash.windowFlags()}")
+    print(f"Window icon null: {splash.windowIcon().isNull()}")
+    print(f"Window title: {splash.windowTitle()}")
+
+    splash.setWindowTitle("ZULF-NMR Suite - Loading")  # Set title for taskbar
+    splash.show()
+    splash.raise_()
+    splash.activateWindow()
+
+    state = {}
+
+    def finish():
+        state['visible'] = splash.isVisible()
+        state['has_icon'] = not splash.windowIcon().isNull()
+        app.quit()
+
+    QTimer.singleShot(SHOW_MS, finish)
+    app.exec()
+    splash.close()
+    return state
+
+
+def test_splash_icon(qapp):
+    state = show_splash_with_icon(qapp)
+    assert state['visible']
+    assert state['has_icon']
+
+
+def main():
+    set_app_user_model_id()
+
+    # Reuse an existing QApplication (e.g. from the pytest qapp fixture)
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    state = show_splash_with_icon(app)
+    assert state['visible'], "Splash screen was not visible"
+    assert state['has_icon'], "Splash screen has no window icon"
+    print("[OK] Splash screen was visible with its window icon")
+
+
+if __name__ == "__main__":
+    main()
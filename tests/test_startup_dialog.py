@@ -2,6 +2,9 @@
 Test Startup Dialog
 
 Quick test script for the startup configuration dialog.
+
+Run standalone to click through the dialogs by hand, or with pytest to
+accept them automatically.
 """
 
 import sys
@@ -9,70 +12,117 @@ from pathlib import Path
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
-from PySide6.QtWidgets import QApplication
+from PySide6.QtCore import QEventLoop, QTimer
+from PySide6.QtWidgets import QApplication, QDialog
 from src.ui.startup_dialog import StartupDialog
 
 
+# Test with different initialization scenarios
+init_results_all = {
+    'matlab_available': True,
+    'python_simulation_available': True,
+    'network_available': True,
+    'file_integrity': True
+}
+
+# MATLAB failed, only Python available
+init_results_python = {
+    'matlab_available': False,
+    'python_simulation_available': True,
+    'network_available': False,
+    'file_integrity': True
+}
+
+
+def on_config_selected(config):
+    print(f"\nSelected configuration:")
+    print(f"  Use MATLAB: {config['use_matlab']}")
+    print(f"  Execution: {config['execution']}")
+    print(f"  UI-only mode: {config['ui_only_mode']}")
+
+    # Show which engine will actually be used
+    if config['ui_only_mode']:
+        print(f"  Actual engine: None (UI-only)")
+    elif config['use_matlab']:
+        print(f"  Actual engine: MATLAB Spinach")
+    else:
+        print(f"  Actual engine: Pure Python")
+
+
+def run_dialogs(scenarios, auto_accept=False):
+    """
+    Show one StartupDialog per scenario at once and wait until all are closed.
+
+    The dialogs are shown non-modally and share a single QEventLoop, so
+    several scenarios can be driven together instead of one exec() each.
+
+    Args:
+        scenarios: List of initialization results, one dialog each
+        auto_accept: Press "Start Application" as soon as the event loop
+            runs instead of waiting for the user
+
+    Returns:
+        list: (accepted, list of configs emitted by config_selected) per scenario
+    """
+    loop = QEventLoop()
+    dialogs = []
+    outcomes = []
+    pending = len(scenarios)
+
+    def on_finished(_result):
+        nonlocal pending
+        pending -= 1
+        if pending == 0:
+            loop.quit()
+
+    for init_results in scenarios:
+        dialog = StartupDialog(init_results)
+        emitted = []
+        dialog.config_selected.connect(emitted.append)
+        dialog.config_selected.connect(on_config_selected)
+        dialog.finished.connect(on_finished)
+        dialog.show()
+        if auto_accept:
+            QTimer.singleShot(0, dialog.accept_config)
+        dialogs.append(dialog)
+        outcomes.append(emitted)
+
+    loop.exec()
+
+    results = []
+    for dialog, emitted in zip(dialogs, outcomes):
+        accepted = dialog.result() == QDialog.DialogCode.Accepted
+        if accepted:
+            print("\nUser accepted configuration")
+        else:
+            print("\nUser cancelled")
+        results.append((accepted, emitted))
+    return results
+
+
+def test_startup_dialogs_accept(qapp):
+    (accepted_all, emitted_all), (accepted_py, emitted_py) = run_dialogs(
+        [init_results_all, init_results_python], auto_accept=True
+    )
+    assert accepted_all and accepted_py
+    assert len(emitted_all) == 1 and len(emitted_py) == 1
+    assert emitted_all[0]['execution'] == 'local'
+    assert not emitted_py[0]['ui_only_mode']
+
+
 def main():
-    app = QApplication(sys.argv)
-    
-    # Test with different initialization scenarios
-    
+    # Reuse an existing QApplication (e.g. from the pytest qapp fixture)
+    app = QApplication.instance() or QApplication(sys.argv)
+
     print("Test 1: All capabilities available")
-    init_results_all = {
-        'matlab_available': True,
-        'python_simulation_available': True,
-        'network_available': True,
-        'file_integrity': True
-    }
-    
-    dialog1 = StartupDialog(init_results_all)
-    
-    def on_config_selected(config):
-        print(f"\nSelected configuration:")
-        print(f"  Use MATLAB: {config['use_matlab']}")
-        print(f"  Execution: {config['execution']}")
-        print(f"  UI-only mode: {config['ui_only_mode']}")
-        
-        # Show which engine will actually be used
-        if config['ui_only_mode']:
-            print(f"  Actual engine: None (UI-only)")
-        elif config['use_matlab']:
-            print(f"  Actual engine: MATLAB Spinach")
-        else:
-            print(f"  Actual engine: Pure Python")
-    
-    dialog1.config_selected.connect(on_config_selected)
-    
-    result = dialog1.exec()
-    
-    if result == dialog1.Accepted:
-        print("\nUser accepted configuration")
-    else:
-        print("\nUser cancelled")
-    
-    # Test 2: Only Python available (MATLAB failed)
+    run_dialogs([init_results_all])
+
     print("\n" + "="*60)
     print("Test 2: MATLAB unavailable, Python only")
-    
-    init_results_python = {
-        'matlab_available': False,
-        'python_simulation_available': True,
-        'network_available': False,
-        'file_integrity': True
-    }
-    
-    dialog2 = StartupDialog(init_results_python)
-    dialog2.config_selected.connect(on_config_selected)
-    
-    result2 = dialog2.exec()
-    
-    if result2 == dialog2.Accepted:
-        print("\nUser accepted configuration")
-    else:
-        print("\nUser cancelled")
+    run_dialogs([init_results_python])
 
 
 if __name__ == "__main__":
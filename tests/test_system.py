@@ -5,53 +5,17 @@ This test verifies the configuration system and imports
 without requiring MATLAB to be installed.
 """
 
+import os
 import sys
 from pathlib import Path
 
 # Add parent directory to path
 parent_dir = Path(__file__).parent.parent
-sys.path.insert(0, str(parent_dir))
-
-print("=" * 60)
-print("Configuration and Import Test")
-print("=" * 60)
-print()
-
-# Test 1: Configuration Module
-print("1. Testing configuration module...")
-try:
-    from src.utils.config import config
-    print(f"   ✓ Config loaded successfully")
-    print(f"   - App Name: {config.app_name}")
-    print(f"   - Version: {config.app_version}")
-    print(f"   - Python Env: {config.get('PYTHON_ENV_PATH')}")
-    print()
-except Exception as e:
-    print(f"   ✗ Config failed: {e}")
-    sys.exit(1)
-
-# Test 2: Splash Screen Module
-print("2. Testing splash screen module...")
-try:
-    from src.ui.splash_screen import SplashScreen, AnimatedLoadingWidget
-    print(f"   ✓ Splash screen imported successfully")
-    print()
-except Exception as e:
-    print(f"   ✗ Splash screen failed: {e}")
-    sys.exit(1)
-
-# Test 3: Save/Load Module
-print("3. Testing save/load module...")
-try:
-    from src.utils.Save_Load import SaveLoad, MoleculeData, ParameterData
-    print(f"   ✓ Save/Load imported successfully")
-    print()
-except Exception as e:
-    print(f"   ✗ Save/Load failed: {e}")
-    sys.exit(1)
+if str(parent_dir) not in sys.path:
+    sys.path.insert(0, str(parent_dir))
+
+project_root = Path(__file__).parent.parent  # Go up to MUI_10_7
 
-# Test 4: File Structure
-print("4. Checking file structure...")
 required_dirs = [
     'src/core',
     'src/ui',
@@ -64,21 +28,6 @@ required_dirs = [
     'docs',
 ]
 
-project_root = Path(__file__).parent.parent  # Go up to MUI_10_7
-all_exist = True
-
-for dir_path in required_dirs:
-    full_path = project_root / dir_path
-    if full_path.exists():
-        print(f"   ✓ {dir_path}")
-    else:
-        print(f"   ✗ {dir_path} - MISSING")
-        all_exist = False
-
-print()
-
-# Test 5: Required Files
-print("5. Checking required files...")
 required_files = [
     'config.txt',
     'run.py',
@@ -90,46 +39,135 @@ required_files = [
     'src/simulation/ui/simulation_window.py',
 ]
 
-for file_path in required_files:
-    full_path = project_root / file_path
-    if full_path.exists():
-        print(f"   ✓ {file_path}")
-    else:
-        print(f"   ✗ {file_path} - MISSING")
-        all_exist = False
 
-print()
+# Parent directory -> {entry name: is_dir}, one scandir per parent
+_listings = {}
 
-# Test 6: Animation Assets
-print("6. Checking animation assets...")
-video_path = config.get('VIDEO_ANIMATION', 'assets/animations/Starting_Animation.mp4')
-gif_path = config.get('GIF_ANIMATION', 'assets/animations/Ajoy-Lab-Spin-Animation-Purple.gif')
 
-video_file = project_root / video_path
-gif_file = project_root / gif_path
+def _list_dir(rel_dir):
+    """Return (and cache) the entries of a directory below project_root"""
+    if rel_dir not in _listings:
+        try:
+            with os.scandir(project_root / rel_dir) as entries:
+                _listings[rel_dir] = {e.name: e.is_dir() for e in entries}
+        except OSError:
+            _listings[rel_dir] = {}
+    return _listings[rel_dir]
 
-if video_file.exists():
-    print(f"   ✓ Video: {video_path}")
-else:
-    print(f"   ! Video: {video_path} - Not found (optional)")
 
-if gif_file.exists():
-    print(f"   ✓ GIF: {gif_path}")
-else:
-    print(f"   ! GIF: {gif_path} - Not found (optional)")
+def _is_dir(rel_path):
+    """True for a directory, False for a file, None if missing (cached lookup)"""
+    parent, _, name = rel_path.replace('\\', '/').rpartition('/')
+    return _list_dir(parent).get(name)
 
-print()
 
-# Summary
-print("=" * 60)
-if all_exist:
-    print("✓ All tests passed!")
-    print("  Configuration system is working correctly")
-    print("  File structure is complete")
+def check_paths(paths, title, want_dirs):
+    """Print a ✓/✗ line per path; return True if all exist with the right kind"""
+    print(title)
+    all_exist = True
+    for rel_path in paths:
+        if _is_dir(rel_path) is want_dirs:
+            print(f"   ✓ {rel_path}")
+        else:
+            print(f"   ✗ {rel_path} - MISSING")
+            all_exist = False
     print()
-    print("Note: MATLAB engine test skipped (requires MATLAB installation)")
-else:
-    print("✗ Some tests failed")
-    print("  Please check the errors above")
+    return all_exist
+
+
+def check_config():
+    """Import the configuration module (no Qt); exit on failure"""
+    print("3. Testing configuration module...")
+    try:
+        from src.utils.config import config
+        print(f"   ✓ Config loaded successfully")
+        print(f"   - App Name: {config.app_name}")
+        print(f"   - Version: {config.app_version}")
+        print(f"   - Python Env: {config.get('PYTHON_ENV_PATH')}")
+        print()
+    except Exception as e:
+        print(f"   ✗ Config failed: {e}")
+        sys.exit(1)
+    return config
+
+
+def check_splash_import():
+    """Import the splash screen (pulls in PySide6); exit on failure"""
+    print("4. Testing splash screen module...")
+    try:
+        from src.ui.splash_screen import SplashScreen, AnimatedLoadingWidget
+        print(f"   ✓ Splash screen imported successfully")
+        print()
+    except Exception as e:
+        print(f"   ✗ Splash screen failed: {e}")
+        sys.exit(1)
+
+
+def check_saveload_import():
+    """Import the save/load module; exit on failure"""
+    print("5. Testing save/load module...")
+    try:
+        from src.utils.Save_Load import SaveLoad, MoleculeData, ParameterData
+        print(f"   ✓ Save/Load imported successfully")
+        print()
+    except Exception as e:
+        print(f"   ✗ Save/Load failed: {e}")
+        sys.exit(1)
+
+
+def check_animation_assets(config):
+    """Report optional splash animation files"""
+    print("6. Checking animation assets...")
+    video_path = config.get('VIDEO_ANIMATION', 'assets/animations/Starting_Animation.mp4')
+    gif_path = config.get('GIF_ANIMATION', 'assets/animations/Ajoy-Lab-Spin-Animation-Purple.gif')
+
+    if _is_dir(video_path) is not None:
+        print(f"   ✓ Video: {video_path}")
+    else:
+        print(f"   ! Video: {video_path} - Not found (optional)")
+
+    if _is_dir(gif_path) is not None:
+        print(f"   ✓ GIF: {gif_path}")
+    else:
+        print(f"   ! GIF: {gif_path} - Not found (optional)")
+
+    print()
+
+
+def main():
+    print("=" * 60)
+    print("Configuration and Import Test")
+    print("=" * 60)
+    print()
+
+    # Cheap filesystem checks first; the module imports below are only
+    # attempted (and PySide6 only loaded) when the tree is complete
+    all_exist = check_paths(required_dirs, "1. Checking file structure...", want_dirs=True)
+    all_exist = check_paths(required_files, "2. Checking required files...", want_dirs=False) and all_exist
+
+    config = check_config()
+    if all_exist:
+        check_splash_import()
+        check_saveload_import()
+    else:
+        print("4-5. Skipping module imports - required files are missing")
+        print()
+    check_animation_assets(config)
+
+    # Summary
+    print("=" * 60)
+    if all_exist:
+        print("✓ All tests passed!")
+        print("  Configuration system is working correctly")
+        print("  File structure is complete")
+        print()
+        print("Note: MATLAB engine test skipped (requires MATLAB installation)")
+    else:
+        print("✗ Some tests failed")
+        print("  Please check the errors above")
+
+    print("=" * 60)
+
 
-print("=" * 60)
+if __name__ == "__main__":
+    main()